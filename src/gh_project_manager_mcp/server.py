@@ -1,32 +1,54 @@
 #!/usr/bin/env python
 """GitHub Project Manager MCP server with stdio transport."""
 
+import functools
+import importlib
+import importlib.util
+import logging
 import os
 import sys
+from typing import Tuple
 
-import anyio
-from mcp.server.fastmcp import FastMCP
-from mcp.server.stdio import stdio_server
+from gh_project_manager_mcp.utils.gh_utils import get_github_token, print_stderr
 
-# Import tool modules
-from gh_project_manager_mcp.tools import issues as issues_tools
-from gh_project_manager_mcp.tools import projects as project_tools
-from gh_project_manager_mcp.tools import pull_requests as pr_tools
-from gh_project_manager_mcp.utils.gh_utils import print_stderr
+logger = logging.getLogger(__name__)
 
 # Replace the global print function to ensure stdout is reserved for JSON-RPC messages
 print = print_stderr
 
+# Tool modules under gh_project_manager_mcp.tools, in registration order
+_TOOL_MODULES: Tuple[str, ...] = ("issues", "projects", "pull_requests")
 
+
+def list_capabilities() -> Tuple[str, ...]:
+    """Return the names of the tool modules the server registers.
+
+    The modules are not imported, so this is cheap to call for introspection.
+
+    Returns
+    -------
+        Tuple of tool module names
+
+    """
+    return _TOOL_MODULES
+
+
+@functools.lru_cache(maxsize=1)
 def create_server():
     """Initialize the FastMCP server and register tools.
 
+    The server is built once per process and reused by later calls; call
+    ``create_server.cache_clear()`` to force a fresh instance.
+
     Returns
     -------
         FastMCP: The initialized server instance
 
     """
-    print("Initializing server...")
+    # Deferred so importing this module doesn't pull in the MCP SDK
+    from mcp.server.fastmcp import FastMCP
+
+    logger.info("Initializing server...")
     # Instantiate server
     server = FastMCP(
         title="GitHub Project Manager MCP",
@@ -38,32 +60,36 @@ def create_server():
     )
 
     # Register tools
-    print("Registering tools...")
-    issues_tools.init_tools(server)
-    project_tools.init_tools(server)
-    pr_tools.init_tools(server)
-    print("Tool registration complete.")
+    logger.info("Registering tools...")
+    for module_name in _TOOL_MODULES:
+        module = importlib.import_module(f"gh_project_manager_mcp.tools.{module_name}")
+        module.init_tools(server)
+    logger.info("Tool registration complete.")
 
     return server
 
 
 async def run_async() -> None:
     """Run the server asynchronously with stdio transport."""
-    print("Starting GitHub Project Manager MCP (stdio transport)...")
+    from mcp.server.stdio import stdio_server
+
+    logger.info("Starting GitHub Project Manager MCP (stdio transport)...")
 
     # Check for GitHub token and exit if not found
-    token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+    token = get_github_token()
     if not token:
-        print("Error: GitHub token not found in environment.")
-        print("       Please set GITHUB_TOKEN or GH_TOKEN environment variable.")
+        logger.error(
+            "GitHub token not found in environment. "
+            "Please set GITHUB_TOKEN or GH_TOKEN environment variable."
+        )
         sys.exit(1)
     else:
-        print("Found GitHub token, proceeding with startup.")
+        logger.info("Found GitHub token, proceeding with startup.")
 
     # Initialize the server and all tools
     server = create_server()
 
-    print("Server initialized, switching to stdio mode...")
+    logger.info("Server initialized, switching to stdio mode...")
 
     # Create initialization options
     initialization_options = server._mcp_server.create_initialization_options()
@@ -71,18 +97,15 @@ async def run_async() -> None:
     try:
         # Use the stdio_server context manager to handle stdin/stdout streams
         async with stdio_server() as (read_stream, write_stream):
-            print("Server connected to stdio, ready for MCP client communication")
+            logger.info("Server connected to stdio, ready for MCP client communication")
             await server._mcp_server.run(
                 read_stream,
                 write_stream,
                 initialization_options,
             )
-            print("Server run completed successfully.")
+            logger.info("Server run completed successfully.")
     except Exception as e:
-        import traceback
-
-        print(f"Error running server: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Error running server: %s", e)
         sys.exit(1)
 
 
@@ -93,24 +116,38 @@ def main() -> None:
     transport mechanism, which allows it to communicate via standard
     input/output streams, making it compatible with MCP clients.
     """
+    import asyncio
+
+    # Diagnostics go to stderr; stdout is reserved for JSON-RPC messages
+    level_name = os.environ.get("MCP_LOG_LEVEL", "WARNING").upper()
+    logging.basicConfig(
+        stream=sys.stderr,
+        level=logging.getLevelNamesMapping().get(level_name, logging.WARNING),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    # uvloop is an optional extra; use the default asyncio loop without it
+    loop_factory = None
+    if importlib.util.find_spec("uvloop") is not None:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+
     try:
-        # Run the async function with anyio
-        anyio.run(run_async)
+        # Run directly on asyncio; the MCP SDK still uses anyio internally
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(run_async())
     except KeyboardInterrupt:
-        print("Server stopped by user.")
+        logger.info("Server stopped by user.")
     except Exception as e:
-        import traceback
-
-        print(f"Error running server: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Error running server: %s", e)
         sys.exit(1)
 
 
 # --- Execution Guard --- #
 if __name__ == "__main__":
     # Check for GH_TOKEN before starting
-    token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
-    if not token:
+    if not get_github_token():
         print(
             "Error: GitHub token not found in environment. Server cannot start.",
             file=sys.stderr,
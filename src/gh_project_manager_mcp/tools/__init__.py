@@ -1,50 +1,71 @@
 """GitHub Project Manager MCP tools package."""
 
+import functools
 import inspect
-from typing import Any, Dict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional
 
 # Export modules
 __all__ = ["issues", "pull_requests"]
 
 
-def tool_registry_info() -> Dict[str, Any]:
+@dataclass(slots=True)
+class ToolInfo:
+    """Describe one tool handler found on a server."""
+
+    name: str
+    function: str
+    signature: Optional[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the tool info to a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+@functools.lru_cache(maxsize=256)
+def _signature_str(handler: Callable[..., Any]) -> str:
+    """Return the signature of a tool handler as a string, computed once."""
+    return str(inspect.signature(handler))
+
+
+def tool_registry_info(server: Any) -> Dict[str, Any]:
     """Return information about registered tools for diagnostic purposes.
 
     This can be called from the console or diagnostic endpoints
     to verify if the tools were registered correctly.
 
-    Returns
+    Args:
+    ----
+        server: The FastMCP instance returned by ``server.create_server()``
+
+    Returns:
     -------
-        Dict with tool registration information
+        JSON-serializable dict with tool registration information; each
+        registered tool is listed as a ToolInfo dict
 
     """
     info = {"discovery": {}, "registered_tools": []}
 
-    # Try to inspect the FastMCP module to find registered tools
+    # Look up the handler table directly; most servers have one
     try:
-        # Get server instance - for diagnostic only
-        from gh_project_manager_mcp.server import server
-
-        if hasattr(server, "_mcp_server"):
-            mcp_server = server._mcp_server
-            info["discovery"]["server_found"] = True
-
-            # Try to access registered tools
-            if hasattr(mcp_server, "_tool_handlers"):
-                handlers = mcp_server._tool_handlers
-                info["discovery"]["handlers_found"] = True
-                info["discovery"]["handler_count"] = len(handlers)
-
-                # List registered tools
-                for name, handler in handlers.items():
-                    tool_info = {
-                        "name": name,
-                        "function": str(handler),
-                        "signature": str(inspect.signature(handler))
-                        if callable(handler)
-                        else None,
-                    }
-                    info["registered_tools"].append(tool_info)
+        handlers = server._mcp_server._tool_handlers
+    except AttributeError:
+        info["discovery"]["error"] = "handlers not found"
+        return info
+
+    info["discovery"]["server_found"] = True
+    info["discovery"]["handlers_found"] = True
+    info["discovery"]["handler_count"] = len(handlers)
+
+    # List registered tools
+    try:
+        for name, handler in handlers.items():
+            tool_info = ToolInfo(
+                name=name,
+                function=str(handler),
+                signature=_signature_str(handler) if callable(handler) else None,
+            )
+            info["registered_tools"].append(tool_info.to_dict())
     except Exception as e:
         info["discovery"]["error"] = str(e)
 
@@ -62,18 +83,15 @@ def discover_tools() -> Dict[str, Any]:
         Information about the discovered tool functions
 
     """
-    info = {"discovery": {}, "registered_tools": []}
-
-    # Get all module level functions
-    module_funcs = {}
-    for name, obj in globals().items():
-        if inspect.isfunction(obj) and inspect.getmodule(obj) == inspect.getmodule(
-            discover_tools
-        ):
-            module_funcs[name] = obj
-
-    info["discovery"] = {
-        "module_functions": list(module_funcs.keys()),
+    return {
+        "discovery": {"module_functions": list(_MODULE_FUNCS)},
+        "registered_tools": [],
     }
 
-    return info
+
+# Module level functions, collected once after all definitions above
+_MODULE_FUNCS: Dict[str, Callable[..., Any]] = {
+    name: obj
+    for name, obj in globals().items()
+    if inspect.isfunction(obj) and obj.__module__ == __name__
+}
@@ -1,9 +1,9 @@
 """Implementations for GitHub issue-related MCP tools."""
 
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Sequence, Union
 
 from mcp.server.fastmcp import FastMCP
-from result import Err
+from result import Err, Ok, Result
 
 from gh_project_manager_mcp.utils.config import resolve_param
 from gh_project_manager_mcp.utils.error import (
@@ -11,13 +11,132 @@ from gh_project_manager_mcp.utils.error import (
     ErrorCode,
 )
 from gh_project_manager_mcp.utils.gh_utils import (
+    as_csv,
     execute_gh_command,
-    print_stderr,
+    execute_gh_command_cached,
+    execute_gh_commands,
+    invalidate_read_cache,
+    require_repo,
 )
 from gh_project_manager_mcp.utils.response_handler import handle_result
 
+# Reasons accepted by `gh issue close --reason`, in the order shown to users
+CLOSE_REASONS = ("completed", "not planned", "duplicate")
+_CLOSE_REASON_SET = frozenset(CLOSE_REASONS)
+
+# `--json` field lists, joined once at import and shared by every call
+ISSUE_LIST_FIELDS = ",".join(
+    (
+        "number",
+        "title",
+        "state",
+        "url",
+        "createdAt",
+        "updatedAt",
+        "labels",
+        "assignees",
+    )
+)
+ISSUE_VIEW_FIELDS = ",".join(
+    (
+        "number",
+        "title",
+        "state",
+        "url",
+        "body",
+        "createdAt",
+        "updatedAt",
+        "labels",
+        "assignees",
+        "comments",
+        "author",
+        "closedAt",
+    )
+)
+
+
+def _execute_write(command: List[str], slug: str, **kwargs: Any) -> Result[str, Error]:
+    """Execute a command that modifies a repository and drop its cached reads.
+
+    Args:
+    ----
+        command: The gh command to execute
+        slug: The owner/repo slug of the modified repository
+        **kwargs: Extra arguments for execute_gh_command, e.g. ``input_text``
+
+    Returns:
+    -------
+        The Result of the command
+
+    """
+    result = execute_gh_command(command, **kwargs)
+    invalidate_read_cache(slug)
+
+    return result
+
+
+def _execute_writes(
+    commands: Sequence[List[str]], slug: str
+) -> List[Result[str, Error]]:
+    """Execute independent commands that modify one repository concurrently.
+
+    The repository's cached reads are dropped once, after the whole batch.
+
+    Args:
+    ----
+        commands: The gh commands to execute
+        slug: The owner/repo slug of the modified repository
+
+    Returns:
+    -------
+        One Result per command, in the same order as ``commands``
+
+    """
+    results = execute_gh_commands(commands, write=True)
+    invalidate_read_cache(slug)
+
+    return results
+
+
+def _edit_command(
+    issue_identifier: str,
+    slug: str,
+    title: str = None,
+    body: str = None,
+    add_assignees: Sequence[str] = (),
+    remove_assignees: Sequence[str] = (),
+    add_labels: Sequence[str] = (),
+    remove_labels: Sequence[str] = (),
+    add_projects: Sequence[str] = (),
+    remove_projects: Sequence[str] = (),
+    milestone: Union[str, int] = None,
+) -> List[str]:
+    """Build the ``gh issue edit`` command for edit_issue's arguments."""
+    # Build the command with repo specification
+    command = ["issue", "edit", issue_identifier, "--repo", slug]
+
+    # Add optional parameters; list values are passed comma-separated
+    for flag, value in (
+        ("--title", title),
+        ("--body", body),
+        ("--add-assignee", add_assignees),
+        ("--remove-assignee", remove_assignees),
+        ("--add-label", add_labels),
+        ("--remove-label", remove_labels),
+        ("--add-project", add_projects),
+        ("--remove-project", remove_projects),
+        ("--milestone", milestone),
+    ):
+        csv = as_csv(value)
+        if csv:
+            command.append(flag)
+            command.append(csv)
+
+    return command
+
 
 @handle_result
+@require_repo
 def create_issue(
     title: str,
     owner: str = None,
@@ -26,6 +145,8 @@ def create_issue(
     assignee: str = None,
     labels: List[str] = None,
     project: str = None,
+    *,
+    slug: str = None,
 ) -> Dict[str, Any]:
     """Create a GitHub issue.
 
@@ -38,6 +159,7 @@ def create_issue(
         assignee: GitHub username to assign the issue to
         labels: List of labels to apply to the issue
         project: Project to add the issue to
+        slug: The owner/repo slug, filled in by require_repo (not a tool input)
 
     Returns:
     -------
@@ -45,58 +167,38 @@ def create_issue(
 
     """
     # Resolve parameters from config or runtime values
-    owner_val = resolve_param("global", "owner", owner)
-    repo_val = resolve_param("global", "repo", repo).replace("_", "-")
     body_val = resolve_param("issue", "body", body)
     assignee_val = resolve_param("issue", "assignee", assignee)
     labels_val = resolve_param("issue", "labels", labels)
     project_val = resolve_param("issue", "project", project)
 
-    # Validate required parameters
-    if owner_val is None:
-        error = Error.required_param_missing(param="owner")
-        return Err(error)
-
-    if repo_val is None:
-        error = Error.required_param_missing(param="repo")
-        return Err(error)
-
-    # Build the command
-    command = ["issue", "create"]
-
-    # Add repo specification
-    command.extend(["-R", f"{owner_val}/{repo_val}"])
-
-    # Add title
-    command.extend(["--title", title])
-
-    # Add optional parameters
-    if body_val:
-        command.extend(["--body", body_val])
-
-    if assignee_val:
-        command.extend(["--assignee", assignee_val])
+    # Build the command with repo specification and title
+    command = ["issue", "create", "-R", slug, "--title", title]
 
-    if labels_val:
-        if isinstance(labels_val, list):
-            command.extend(["--label", ",".join(labels_val)])
-        else:
-            command.extend(["--label", labels_val])
+    # Add optional parameters; list values are passed comma-separated
+    for flag, value in (
+        ("--body", body_val),
+        ("--assignee", assignee_val),
+        ("--label", labels_val),
+        ("--project", project_val),
+    ):
+        csv = as_csv(value)
+        if csv:
+            command.append(flag)
+            command.append(csv)
 
-    if project_val:
-        command.extend(["--project", project_val])
-
-    # Execute the command
-    result = execute_gh_command(command)
-
-    return result
+    # Execute the command and drop cached reads of this repository
+    return _execute_write(command, slug)
 
 
 @handle_result
+@require_repo
 def get_issue(
     issue_number: int,
     owner: str = None,
     repo: str = None,
+    *,
+    slug: str = None,
 ) -> Dict[str, Any]:
     """Get details of a specific GitHub issue by number.
 
@@ -105,40 +207,75 @@ def get_issue(
         issue_number: The issue number to view
         owner: The repository owner (falls back to GH_REPO_OWNER env var)
         repo: The repository name (falls back to GH_REPO_NAME env var)
+        slug: The owner/repo slug, filled in by require_repo (not a tool input)
 
     Returns:
     -------
         Result containing either the issue details or Error
 
     """
-    # Resolve parameters from config or runtime values
-    owner_val = resolve_param("global", "owner", owner)
-    repo_val = resolve_param("global", "repo", repo).replace("_", "-")
-
-    # Validate required parameters
-    if owner_val is None:
-        return Err(Error.required_param_missing(param="owner"))
-
-    if repo_val is None:
-        return Err(Error.required_param_missing(param="repo"))
-
-    # Build the command
+    # Build the command with repo specification
     command = [
         "issue",
         "view",
         str(issue_number),
         "--json",
-        "number,title,state,url,body,createdAt,updatedAt,labels,assignees,comments,author,closedAt",
+        ISSUE_VIEW_FIELDS,
+        "--repo",
+        slug,
     ]
 
-    # Add repo specification
-    command.extend(["--repo", f"{owner_val}/{repo_val}"])
-
     # Execute the command
-    return execute_gh_command(command)
+    return execute_gh_command_cached(command)
 
 
 @handle_result
+@require_repo
+def get_issues(
+    issue_numbers: List[int],
+    owner: str = None,
+    repo: str = None,
+    *,
+    slug: str = None,
+) -> Dict[str, Any]:
+    """Get details of several GitHub issues at once.
+
+    The issues are fetched concurrently, one ``gh issue view`` per number,
+    sharing get_issue's short-lived read cache.
+
+    Args:
+    ----
+        issue_numbers: The issue numbers to view
+        owner: The repository owner (falls back to GH_REPO_OWNER env var)
+        repo: The repository name (falls back to GH_REPO_NAME env var)
+        slug: The owner/repo slug, filled in by require_repo (not a tool input)
+
+    Returns:
+    -------
+        Result containing either the list of issue details or the first Error
+
+    """
+    if not issue_numbers:
+        return Err(Error.required_param_missing(param="issue_numbers"))
+
+    # Build one command per issue
+    commands = [
+        ["issue", "view", str(number), "--json", ISSUE_VIEW_FIELDS, "--repo", slug]
+        for number in issue_numbers
+    ]
+
+    # Execute the commands concurrently and combine the JSON objects
+    outputs = []
+    for result in execute_gh_commands(commands, cached=True):
+        if isinstance(result, Err):
+            return result
+        outputs.append(result.ok_value)
+
+    return Ok(f"[{','.join(outputs)}]")
+
+
+@handle_result
+@require_repo
 def list_issues(
     limit: int,
     owner: str = None,
@@ -147,8 +284,10 @@ def list_issues(
     assignee: str = None,
     creator: str = None,
     mentioned: str = None,
-    labels: List[str] = None,
+    labels: Sequence[str] = (),
     milestone: str = None,
+    *,
+    slug: str = None,
 ) -> Dict[str, Any]:
     """List GitHub issues with optional filtering.
 
@@ -163,65 +302,46 @@ def list_issues(
         mentioned: Filter by mentioned username
         labels: List of labels to filter by
         milestone: Filter by milestone
+        slug: The owner/repo slug, filled in by require_repo (not a tool input)
 
     Returns:
     -------
         Result containing either the list of issues or Error
 
     """
-    # Resolve parameters from config or runtime values
-    owner_val = resolve_param("global", "owner", owner)
-    repo_val = resolve_param("global", "repo", repo).replace("_", "-")
-
-    # Validate required parameters
-    if owner_val is None:
-        return Err(Error.required_param_missing(param="owner"))
-
-    if repo_val is None:
-        return Err(Error.required_param_missing(param="repo"))
-
-    # Build the command
-    command = [
-        "issue",
-        "list",
-        "--json",
-        "number,title,state,url,createdAt,updatedAt,labels,assignees",
-    ]
-
-    # Add repo specification
-    command.extend(["--repo", f"{owner_val}/{repo_val}"])
-
-    # Add optional parameters
-    if state:
-        command.extend(["--state", state])
-    if assignee:
-        command.extend(["--assignee", assignee])
-    if creator:
-        command.extend(["--author", creator])
-    if mentioned:
-        command.extend(["--mention", mentioned])
-    if milestone:
-        command.extend(["--milestone", milestone])
-    if labels:
-        if isinstance(labels, list):
-            for label in labels:
-                command.extend(["--label", label])
-        else:
-            command.extend(["--label", labels])
+    # Build the command with repo specification
+    command = ["issue", "list", "--json", ISSUE_LIST_FIELDS, "--repo", slug]
+
+    # Add optional parameters; gh splits comma-separated --label values itself
+    for flag, value in (
+        ("--state", state),
+        ("--assignee", assignee),
+        ("--author", creator),
+        ("--mention", mentioned),
+        ("--milestone", milestone),
+        ("--label", labels),
+    ):
+        csv = as_csv(value)
+        if csv:
+            command.append(flag)
+            command.append(csv)
 
     command.extend(["--limit", str(limit)])
 
     # Execute the command
-    return execute_gh_command(command)
+    return execute_gh_command_cached(command)
 
 
 @handle_result
+@require_repo
 def close_issue(
     issue_identifier: str,
     owner: str = None,
     repo: str = None,
     comment: str = None,
     reason: str = None,
+    *,
+    slug: str = None,
 ) -> Dict[str, Any]:
     """Close a GitHub issue.
 
@@ -232,28 +352,15 @@ def close_issue(
         repo: The repository name (falls back to GH_REPO_NAME env var)
         comment: Optional comment to add while closing the issue
         reason: Reason for closing (completed, not planned, duplicate)
+        slug: The owner/repo slug, filled in by require_repo (not a tool input)
 
     Returns:
     -------
         Result containing either success information or Error
 
     """
-    # Resolve parameters from config or runtime values
-    owner_val = resolve_param("global", "owner", owner)
-    repo_val = resolve_param("global", "repo", repo).replace("_", "-")
-
-    # Validate required parameters
-    if owner_val is None:
-        return Err(Error.required_param_missing(param="owner"))
-
-    if repo_val is None:
-        return Err(Error.required_param_missing(param="repo"))
-
-    # Build the command
-    command = ["issue", "close", issue_identifier]
-
-    # Add repo specification
-    command.extend(["--repo", f"{owner_val}/{repo_val}"])
+    # Build the command with repo specification
+    command = ["issue", "close", issue_identifier, "--repo", slug]
 
     # Add optional parameters
     if comment:
@@ -261,23 +368,26 @@ def close_issue(
 
     # Validate and add reason if provided
     if reason:
-        valid_reasons = ["completed", "not planned", "duplicate"]
-        if reason.lower() in valid_reasons:
-            command.extend(["--reason", reason.lower()])
-        else:
-            return Err(Error.invalid_param(reason, valid_reasons))
+        # Reasons usually arrive lowercase already; only normalize when needed
+        reason_val = reason if reason.islower() else reason.lower()
+        if reason_val not in _CLOSE_REASON_SET:
+            return Err(Error.invalid_param(reason, CLOSE_REASONS))
+        command.extend(["--reason", reason_val])
 
-    # Execute the command
-    return execute_gh_command(command)
+    # Execute the command and drop cached reads of this repository
+    return _execute_write(command, slug)
 
 
 @handle_result
+@require_repo
 def comment_issue(
     issue_identifier: str,
     owner: str = None,
     repo: str = None,
     body: str = None,
     body_file: str = None,
+    *,
+    slug: str = None,
 ) -> Dict[str, Any]:
     """Add a comment to a GitHub issue.
 
@@ -288,23 +398,13 @@ def comment_issue(
         repo: The repository name (falls back to GH_REPO_NAME env var)
         body: Text content of the comment
         body_file: Path to file containing comment text (mutually exclusive with body)
+        slug: The owner/repo slug, filled in by require_repo (not a tool input)
 
     Returns:
     -------
         Result containing either success information or Error
 
     """
-    # Resolve parameters from config or runtime values
-    owner_val = resolve_param("global", "owner", owner)
-    repo_val = resolve_param("global", "repo", repo).replace("_", "-")
-
-    # Validate required parameters
-    if owner_val is None:
-        return Err(Error.required_param_missing(param="owner"))
-
-    if repo_val is None:
-        return Err(Error.required_param_missing(param="repo"))
-
     # Validate that either body or body_file is provided, but not both
     if not body and not body_file:
         return Err(Error.required_params_missing(["body", "body_file"]))
@@ -312,15 +412,13 @@ def comment_issue(
     if body and body_file:
         return Err(Error.invalid_param("body and body_file", ["body", "body_file"]))
 
-    # Build the command
-    command = ["issue", "comment", issue_identifier]
-
-    # Add repo specification
-    command.extend(["--repo", f"{owner_val}/{repo_val}"])
+    # Build the command with repo specification
+    command = ["issue", "comment", issue_identifier, "--repo", slug]
 
-    # Add either body or body_file to the command
+    # Add either body or body_file to the command; an in-memory body is
+    # piped to gh's stdin rather than copied into its argv
     if body:
-        command.extend(["--body", body])
+        command.extend(["--body-file", "-"])
     elif body_file:
         # Handle special stdin case
         if body_file == "-":
@@ -336,16 +434,19 @@ def comment_issue(
             )
         command.extend(["--body-file", body_file])
 
-    # Execute the command
-    return execute_gh_command(command)
+    # Execute the command and drop cached reads of this repository
+    return _execute_write(command, slug, input_text=body)
 
 
 @handle_result
+@require_repo
 def delete_issue(
     issue_identifier: str,
     owner: str = None,
     repo: str = None,
     skip_confirmation: bool = False,
+    *,
+    slug: str = None,
 ) -> Dict[str, Any]:
     """Delete a GitHub issue (requires admin rights).
 
@@ -355,51 +456,41 @@ def delete_issue(
         owner: The repository owner (falls back to GH_REPO_OWNER env var)
         repo: The repository name (falls back to GH_REPO_NAME env var)
         skip_confirmation: Whether to skip the confirmation prompt
+        slug: The owner/repo slug, filled in by require_repo (not a tool input)
 
     Returns:
     -------
         Result containing either success information or Error
 
     """
-    # Resolve parameters from config or runtime values
-    owner_val = resolve_param("global", "owner", owner)
-    repo_val = resolve_param("global", "repo", repo).replace("_", "-")
-
-    # Validate required parameters
-    if owner_val is None:
-        return Err(Error.required_param_missing(param="owner"))
-
-    if repo_val is None:
-        return Err(Error.required_param_missing(param="repo"))
-
-    # Build the command
-    command = ["issue", "delete", issue_identifier]
-
-    # Add repo specification
-    command.extend(["--repo", f"{owner_val}/{repo_val}"])
+    # Build the command with repo specification
+    command = ["issue", "delete", issue_identifier, "--repo", slug]
 
     # Add --yes flag to skip confirmation if requested
     if skip_confirmation:
         command.append("--yes")
 
-    # Execute the command
-    return execute_gh_command(command)
+    # Execute the command and drop cached reads of this repository
+    return _execute_write(command, slug)
 
 
 @handle_result
+@require_repo
 def edit_issue(
     issue_identifier: str,
     owner: str = None,
     repo: str = None,
     title: str = None,
     body: str = None,
-    add_assignees: List[str] = None,
-    remove_assignees: List[str] = None,
-    add_labels: List[str] = None,
-    remove_labels: List[str] = None,
-    add_projects: List[str] = None,
-    remove_projects: List[str] = None,
+    add_assignees: Sequence[str] = (),
+    remove_assignees: Sequence[str] = (),
+    add_labels: Sequence[str] = (),
+    remove_labels: Sequence[str] = (),
+    add_projects: Sequence[str] = (),
+    remove_projects: Sequence[str] = (),
     milestone: Union[str, int] = None,
+    *,
+    slug: str = None,
 ) -> Dict[str, Any]:
     """Edit issue metadata.
 
@@ -417,85 +508,89 @@ def edit_issue(
         add_projects: List of projects to add
         remove_projects: List of projects to remove
         milestone: Milestone to set (name or number)
+        slug: The owner/repo slug, filled in by require_repo (not a tool input)
 
     Returns:
     -------
         Result containing either success information or Error
 
     """
-    # Resolve parameters from config or runtime values
-    owner_val = resolve_param("global", "owner", owner)
-    repo_val = resolve_param("global", "repo", repo).replace("_", "-")
+    command = _edit_command(
+        issue_identifier,
+        slug,
+        title=title,
+        body=body,
+        add_assignees=add_assignees,
+        remove_assignees=remove_assignees,
+        add_labels=add_labels,
+        remove_labels=remove_labels,
+        add_projects=add_projects,
+        remove_projects=remove_projects,
+        milestone=milestone,
+    )
+
+    # Execute the command and drop cached reads of this repository
+    return _execute_write(command, slug)
 
-    # Validate required parameters
-    if owner_val is None:
-        return Err(Error.required_param_missing(param="owner"))
 
-    if repo_val is None:
-        return Err(Error.required_param_missing(param="repo"))
+@handle_result
+@require_repo
+def batch_edit_issues(
+    edits: List[Dict[str, Any]],
+    owner: str = None,
+    repo: str = None,
+    *,
+    slug: str = None,
+) -> Dict[str, Any]:
+    """Edit several issues of one repository at once.
 
-    # Build the command
-    command = ["issue", "edit", issue_identifier]
+    Each edit holds edit_issue's arguments for one issue, for example
+    ``{"issue_identifier": "7", "add_labels": ["bug"]}``. The edits run
+    concurrently, at most MAX_CONCURRENT_GH_WRITES at a time.
 
-    # Add repo specification
-    command.extend(["--repo", f"{owner_val}/{repo_val}"])
+    Args:
+    ----
+        edits: The edits to apply, one dict of edit_issue arguments per issue
+        owner: The repository owner (falls back to GH_REPO_OWNER env var)
+        repo: The repository name (falls back to GH_REPO_NAME env var)
+        slug: The owner/repo slug, filled in by require_repo (not a tool input)
 
-    # Add optional parameters
-    if title:
-        command.extend(["--title", title])
+    Returns:
+    -------
+        Result containing either the outputs of the edits or the first Error
 
-    if body:
-        command.extend(["--body", body])
-
-    if add_assignees:
-        if isinstance(add_assignees, list):
-            command.extend(["--add-assignee", ",".join(add_assignees)])
-        else:
-            command.extend(["--add-assignee", add_assignees])
-
-    if remove_assignees:
-        if isinstance(remove_assignees, list):
-            command.extend(["--remove-assignee", ",".join(remove_assignees)])
-        else:
-            command.extend(["--remove-assignee", remove_assignees])
-
-    if add_labels:
-        if isinstance(add_labels, list):
-            command.extend(["--add-label", ",".join(add_labels)])
-        else:
-            command.extend(["--add-label", add_labels])
-
-    if remove_labels:
-        if isinstance(remove_labels, list):
-            command.extend(["--remove-label", ",".join(remove_labels)])
-        else:
-            command.extend(["--remove-label", remove_labels])
-
-    if add_projects:
-        if isinstance(add_projects, list):
-            command.extend(["--add-project", ",".join(add_projects)])
-        else:
-            command.extend(["--add-project", add_projects])
-
-    if remove_projects:
-        if isinstance(remove_projects, list):
-            command.extend(["--remove-project", ",".join(remove_projects)])
-        else:
-            command.extend(["--remove-project", remove_projects])
-
-    if milestone:
-        command.extend(["--milestone", str(milestone)])
+    """
+    if not edits:
+        return Err(Error.required_param_missing(param="edits"))
 
-    # Execute the command
-    return execute_gh_command(command)
+    # Build one command per edit
+    commands = []
+    for edit in edits:
+        fields = dict(edit)
+        issue_identifier = fields.pop("issue_identifier", None)
+        if not issue_identifier:
+            return Err(Error.required_param_missing(param="issue_identifier"))
+        commands.append(_edit_command(str(issue_identifier), slug, **fields))
+
+    # Execute the commands concurrently and drop cached reads once
+    outputs = []
+    for result in _execute_writes(commands, slug):
+        if isinstance(result, Err):
+            return result
+        outputs.append(result.ok_value)
+
+    return Ok(outputs)
 
 
 @handle_result
+@require_repo
 def reopen_issue(
     issue_identifier: str,
     owner: str = None,
     repo: str = None,
     comment: str = None,
+    *,
+    slug: str = None,
 ) -> Dict[str, Any]:
     """Reopen a closed issue.
 
@@ -505,68 +600,30 @@ def reopen_issue(
         owner: The repository owner (falls back to GH_REPO_OWNER env var)
         repo: The repository name (falls back to GH_REPO_NAME env var)
         comment: Optional comment to add when reopening the issue
+        slug: The owner/repo slug, filled in by require_repo (not a tool input)
 
     Returns:
     -------
         Result containing either success information or Error
 
     """
-    # Resolve parameters from config or runtime values
-    owner_val = resolve_param("global", "owner", owner)
-    repo_val = resolve_param("global", "repo", repo).replace("_", "-")
-
-    # Validate required parameters
-    if owner_val is None:
-        return Err(Error.required_param_missing(param="owner"))
-
-    if repo_val is None:
-        return Err(Error.required_param_missing(param="repo"))
-
-    # Build the command
-    command = ["issue", "reopen", issue_identifier]
-
-    # Add repo specification
-    command.extend(["--repo", f"{owner_val}/{repo_val}"])
+    # Build the command with repo specification
+    command = ["issue", "reopen", issue_identifier, "--repo", slug]
 
     # Add optional comment
     if comment:
         command.extend(["--comment", comment])
 
-    # Execute the command
-    return execute_gh_command(command)
+    # Execute the command and drop cached reads of this repository
+    return _execute_write(command, slug)
 
 
 # --- Tool Registration ---
 
 
 def init_tools(server: FastMCP):
-    """Register issue-related tools with the MCP server."""
-    print_stderr("\n=== Registering Issue Tools ===")  # pragma: no cover
-
-    # Print the function names for logging
-    print_stderr(
-        f"Create issue function name: {create_issue.__name__}"
-    )  # pragma: no cover
-    print_stderr(f"Get issue function name: {get_issue.__name__}")  # pragma: no cover
-    print_stderr(
-        f"List issues function name: {list_issues.__name__}"
-    )  # pragma: no cover
-    print_stderr(
-        f"Delete issue function name: {delete_issue.__name__}"
-    )  # pragma: no cover
-    print_stderr(f"Edit issue function name: {edit_issue.__name__}")  # pragma: no cover
-    print_stderr(
-        f"Reopen issue function name: {reopen_issue.__name__}"
-    )  # pragma: no cover
-
-    # Register the tools
-    # server.tool()(create_issue)  # Register the new implementation
-    # server.tool()(get_issue)  # Register the new implementation
-    # server.tool()(list_issues)  # Register the new implementation
-    # server.tool()(close_issue)  # Register the new implementation
-    # server.tool()(comment_issue)  # Register the new implementation
-    # server.tool()(delete_issue)  # Register the new implementation
-    # server.tool()(edit_issue)  # Register the new implementation
-    # server.tool()(reopen_issue)  # Register the new implementation
-
-    print_stderr("=== Issue Tools Registered ===\n")  # pragma: no cover
+    """Register issue-related tools with the MCP server.
+
+    The issue tools are deliberately left unregistered for now, so the
+    server only exposes the project tools; this registers nothing.
+    """
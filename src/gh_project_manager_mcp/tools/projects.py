@@ -2,10 +2,11 @@
 """Tools for interacting with GitHub Projects via the gh CLI."""
 
 import datetime
+import logging
 from typing import Any, Dict, List
 
 from mcp.server.fastmcp import FastMCP
-from result import Err
+from result import Err, Ok
 
 from gh_project_manager_mcp.utils.config import resolve_param
 from gh_project_manager_mcp.utils.error import (
@@ -14,13 +15,21 @@ from gh_project_manager_mcp.utils.error import (
 )
 from gh_project_manager_mcp.utils.gh_utils import (
     execute_gh_command,
+    execute_gh_commands,
     print_stderr,
+    run_in_thread,
 )
 from gh_project_manager_mcp.utils.response_handler import handle_result
 
 # Replace the global print function
 print = print_stderr
 
+logger = logging.getLogger(__name__)
+
+# Data types accepted by `gh project field-create`, in the order shown to users
+FIELD_DATA_TYPES = ("TEXT", "SINGLE_SELECT", "DATE", "NUMBER", "ITERATION")
+_FIELD_DATA_TYPE_SET = frozenset(FIELD_DATA_TYPES)
+
 # Implementations of gh project commands
 
 # --- Tool Implementations ---
@@ -74,13 +83,12 @@ def create_project_field(
     ]
 
     # Validate data_type
-    valid_data_types = ["TEXT", "SINGLE_SELECT", "DATE", "NUMBER", "ITERATION"]
     data_type_upper = data_type.upper() if data_type else ""
-    if data_type_upper not in valid_data_types:
+    if data_type_upper not in _FIELD_DATA_TYPE_SET:
         return Err(
             Error.invalid_param(
                 data_type,
-                valid_data_types,
+                FIELD_DATA_TYPES,
                 "Invalid data_type. Must be one of the specified values.",
             )
         )
@@ -101,9 +109,10 @@ def create_project_field(
         )
 
     if data_type_upper != "SINGLE_SELECT" and single_select_options:
-        print(
-            f"Warning: single_select_options provided but data_type is "
-            f"'{data_type_upper}'. Options will be ignored."
+        logger.warning(
+            "single_select_options provided but data_type is '%s'. "
+            "Options will be ignored.",
+            data_type_upper,
         )
 
     if data_type_upper == "SINGLE_SELECT" and single_select_options:
@@ -168,9 +177,9 @@ def list_project_fields(
         if isinstance(resolved_limit, int) and resolved_limit > 0:
             command.extend(["--limit", str(resolved_limit)])
         else:
-            print_stderr(
-                "Warning: Invalid limit '{}'. Must be a positive integer. "
-                "Using default.".format(resolved_limit)
+            logger.warning(
+                "Invalid limit '%s'. Must be a positive integer. Using default.",
+                resolved_limit,
             )
 
     # Execute the command
@@ -214,6 +223,53 @@ def add_project_item(
     return execute_gh_command(command)
 
 
+@handle_result
+def add_project_items(
+    urls: List[str],
+    project_id: str = None,
+    owner: str = None,
+) -> Dict[str, Any]:
+    """Add several items (issues or PRs) to a GitHub project at once.
+
+    The items are added concurrently, one ``gh project item-add`` per URL.
+
+    Args:
+    ----
+        urls: URLs of the issues or pull requests to add to the project
+        project_id: The ID of the project
+        owner: The owner of the project (user or organization)
+
+    Returns:
+    -------
+        Result containing either the list of added items or the first Error
+
+    """
+    if not urls:
+        return Err(Error.required_param_missing(param="urls"))
+
+    # Resolve parameters from config or runtime values
+    resolved_project_id = resolve_param("project", "project_id", project_id)
+    resolved_owner = resolve_param("global", "owner", owner)
+
+    if not resolved_project_id:
+        return Err(Error.required_param_missing(param="project_id"))
+
+    # Build the shared command prefix, then one command per URL
+    prefix = ["project", "item-add", resolved_project_id, "--format", "json"]
+    if resolved_owner:
+        prefix.extend(["--owner", resolved_owner])
+    commands = [[*prefix, "--url", url] for url in urls]
+
+    # Execute the commands concurrently and combine the JSON objects
+    outputs = []
+    for result in execute_gh_commands(commands, write=True):
+        if isinstance(result, Err):
+            return result
+        outputs.append(result.ok_value)
+
+    return Ok(f"[{','.join(outputs)}]")
+
+
 @handle_result
 def archive_project_item(
     item_id: str,
@@ -477,9 +533,9 @@ def list_project_items(
         if isinstance(resolved_limit, int) and resolved_limit > 0:
             command.extend(["--limit", str(resolved_limit)])
         else:
-            print_stderr(
-                "Warning: Invalid limit '{}'. Must be a positive integer. "
-                "Using default.".format(resolved_limit)
+            logger.warning(
+                "Invalid limit '%s'. Must be a positive integer. Using default.",
+                resolved_limit,
             )
 
     # Execute the command
@@ -566,105 +622,24 @@ def create_project_item(
 # --- Tool Registration ---
 def init_tools(server: FastMCP):
     """Register project-related tools, resources, and prompts with the MCP server."""
-    print_stderr("\n=== Registering Project Tools ===")  # pragma: no cover
-
-    # Print the function names for logging
-    print_stderr(
-        f"Create project field function name: {create_project_field.__name__}"
-    )  # pragma: no cover
-    print_stderr(
-        f"Delete project field function name: {delete_project_field.__name__}"
-    )  # pragma: no cover
-    print_stderr(
-        f"List project fields function name: {list_project_fields.__name__}"
-    )  # pragma: no cover
-    print_stderr(
-        f"Add project item function name: {add_project_item.__name__}"
-    )  # pragma: no cover
-    print_stderr(
-        f"Archive project item function name: {archive_project_item.__name__}"
-    )  # pragma: no cover
-    print_stderr(
-        f"Delete project item function name: {delete_project_item.__name__}"
-    )  # pragma: no cover
-    print_stderr(
-        f"Edit project item function name: {edit_project_item.__name__}"
-    )  # pragma: no cover
-    print_stderr(
-        f"List project items function name: {list_project_items.__name__}"
-    )  # pragma: no cover
-    print_stderr(
-        f"View project function name: {view_project.__name__}"
-    )  # pragma: no cover
-    print_stderr(
-        f"Create project item function name: {create_project_item.__name__}"
-    )  # pragma: no cover
-
-    # Register the tools
-    server.tool()(create_project_field)
-    server.tool()(delete_project_field)
-    server.tool()(list_project_fields)
-    server.tool()(add_project_item)
-    server.tool()(archive_project_item)
-    server.tool()(delete_project_item)
-    server.tool()(edit_project_item)
-    server.tool()(list_project_items)
-    server.tool()(view_project)
-    server.tool()(create_project_item)
-
-    print_stderr("=== Project Tools Registered ===\n")  # pragma: no cover
+    # Register the tools; each runs in a worker thread while gh is running
+    for tool in _TOOLS:
+        server.tool()(run_in_thread(tool))
 
     # Register resources
-    print_stderr("\n=== Registering Project Resources ===")  # pragma: no cover
-
-    # Register the item details resource
-    server.resource("project-item://{project_id}/{item_id}")(item_details)
-    print_stderr(
-        "Registered resource: project-item://{project_id}/{item_id}"
-    )  # pragma: no cover
-
-    # Register the field options resource
-    server.resource("field://{project_id}/{field_id}/options")(field_options)
-    print_stderr(
-        "Registered resource: field://{project_id}/{field_id}/options"
-    )  # pragma: no cover
-
-    # Register the project fields resource
-    server.resource("project://{project_id}/fields")(project_fields)
-    print_stderr(
-        "Registered resource: project://{project_id}/fields"
-    )  # pragma: no cover
-
-    print_stderr("=== Project Resources Registered ===\n")  # pragma: no cover
+    for uri, resource in _RESOURCES:
+        server.resource(uri)(resource)
 
     # Register prompts
-    print_stderr("\n=== Registering Project Prompts ===")  # pragma: no cover
-
-    # Register the status update prompt
-    server.prompt()(update_status_prompt)
-    print_stderr("Registered prompt: update_status_prompt")  # pragma: no cover
-
-    # Register the due date prompt
-    server.prompt()(set_due_date_prompt)
-    print_stderr("Registered prompt: set_due_date_prompt")  # pragma: no cover
-
-    # Register the priority change prompt
-    server.prompt()(change_priority_prompt)
-    print_stderr("Registered prompt: change_priority_prompt")  # pragma: no cover
-
-    # Register the generic field value prompt
-    server.prompt()(set_field_value_prompt)
-    print_stderr("Registered prompt: set_field_value_prompt")  # pragma: no cover
-
-    # Register the clear field prompt
-    server.prompt()(clear_field_prompt)
-    print_stderr("Registered prompt: clear_field_prompt")  # pragma: no cover
-
-    # Register the bulk status update prompt
-    server.prompt()(bulk_status_update_prompt)
-    print_stderr("Registered prompt: bulk_status_update_prompt")  # pragma: no cover
-
-    print_stderr("=== Project Prompts Registered ===\n")  # pragma: no cover
+    for prompt in _PROMPTS:
+        server.prompt()(prompt)
+
+    logger.debug(
+        "Registered %d project tools, %d resources and %d prompts",
+        len(_TOOLS),
+        len(_RESOURCES),
+        len(_PROMPTS),
+    )
 
 
 # -- RESOURCES --
@@ -883,3 +858,36 @@ def bulk_status_update_prompt(status_from: str, status_to: str, project_id: str)
         f"Find all items in project {project_id} with status '{status_from}' "
         f"and update them to '{status_to}'. This is part of our end-of-sprint cleanup."
     )
+
+
+# --- Registration Tables ---
+# Built once at import so init_tools() is a single pass over each table
+
+_TOOLS = (
+    create_project_field,
+    delete_project_field,
+    list_project_fields,
+    add_project_item,
+    add_project_items,
+    archive_project_item,
+    delete_project_item,
+    edit_project_item,
+    list_project_items,
+    view_project,
+    create_project_item,
+)
+
+_RESOURCES = (
+    ("project-item://{project_id}/{item_id}", item_details),
+    ("field://{project_id}/{field_id}/options", field_options),
+    ("project://{project_id}/fields", project_fields),
+)
+
+_PROMPTS = (
+    update_status_prompt,
+    set_due_date_prompt,
+    change_priority_prompt,
+    set_field_value_prompt,
+    clear_field_prompt,
+    bulk_status_update_prompt,
+)
@@ -1,12 +1,43 @@
 """Configuration management for the GitHub Project Manager MCP server."""
 
+import functools
+import logging
 import os
-from typing import Any, Dict, Optional, TypedDict
-
-from gh_project_manager_mcp.utils.gh_utils import print_stderr
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypedDict,
+)
 
 from .error import ApplicationError, Error
 
+logger = logging.getLogger(__name__)
+
+
+def _split_csv(value: str) -> List[str]:
+    """Split a comma-separated string into a list of non-empty items."""
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _to_bool(value: str) -> bool:
+    """Interpret common truthy strings as True."""
+    return value.lower() in ("true", "yes", "1", "t", "y")
+
+
+# Env var converters keyed by the ParamConfig "type" string
+_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    "str": str,
+    "int": int,
+    "bool": _to_bool,
+    "list": _split_csv,
+}
+
 
 class ParamConfig(TypedDict):
     """Type definition for parameter configuration."""
@@ -16,12 +47,100 @@ class ParamConfig(TypedDict):
     type: str
 
 
+# Default configuration for all parameter categories
+PARAM_DEFAULTS: Dict[str, Dict[str, ParamConfig]] = {
+    "global": {
+        "owner": {
+            "default": None,
+            "env_var": "GH_REPO_OWNER",
+            "type": "str",
+        },
+        "repo": {
+            "default": None,
+            "env_var": "GH_REPO_NAME",
+            "type": "str",
+        },
+        "read_cache_ttl": {
+            "default": 5,
+            "env_var": "GH_READ_CACHE_TTL",
+            "type": "int",
+        },
+    },
+    "issue": {
+        "body": {
+            "default": "Created via GH Project Manager MCP",
+            "env_var": "GH_ISSUE_BODY",
+            "type": "str",
+        },
+        "assignee": {
+            "default": "@me",
+            "env_var": "GH_ISSUE_ASSIGNEE",
+            "type": "str",
+        },
+        "labels": {"default": [], "env_var": "GH_ISSUE_LABELS", "type": "list"},
+        "project": {
+            "default": None,
+            "env_var": "GH_ISSUE_PROJECT",
+            "type": "str",
+        },
+        "issue_list_limit": {
+            "default": 100,
+            "env_var": "GH_ISSUE_LIST_LIMIT",
+            "type": "int",
+        },
+    },
+    # Add pull_request category with approved parameters
+    "pull_request": {
+        "body": {
+            "default": "Created via GH Project Manager MCP",
+            "env_var": "GH_PR_BODY",
+            "type": "str",
+        },
+        "assignee": {
+            "default": "@me",
+            "env_var": "GH_PR_ASSIGNEE",
+            "type": "str",
+        },
+        "base": {
+            "default": "main",
+            "env_var": "GH_PR_BASE_BRANCH",
+            "type": "str",
+        },
+    },
+    # Add project category with all parameters used in projects.py
+    "project": {
+        "project_id": {
+            "default": None,
+            "env_var": "GH_PROJECT_ID",
+            "type": "str",
+        },
+        "project_node_id": {
+            "default": None,
+            "env_var": "GH_PROJECT_NODE_ID",
+            "type": "str",
+        },
+        "field_list_limit": {
+            "default": 100,
+            "env_var": "GH_PROJECT_FIELD_LIST_LIMIT",
+            "type": "int",
+        },
+        "item_list_limit": {
+            "default": 100,
+            "env_var": "GH_PROJECT_ITEM_LIST_LIMIT",
+            "type": "int",
+        },
+    },
+}
+
+
 class ConfigStore:
     """Configuration store for parameter defaults and environment overrides."""
 
     def __init__(self):
         """Initialize the configuration store."""
-        self._config: Dict[str, Dict[str, Any]] = {}
+        # Flat, read-only (category, param_name) -> value table built once
+        self._config: Mapping[Tuple[str, str], Any] = MappingProxyType({})
+        self._categories: frozenset = frozenset()
         self._initialized = False
 
     def initialize(self):
@@ -29,130 +148,50 @@ class ConfigStore:
         if self._initialized:
             return
 
-        # Default configuration for all parameter categories
-        defaults: Dict[str, Dict[str, ParamConfig]] = {
-            "global": {
-                "owner": {
-                    "default": None,
-                    "env_var": "GH_REPO_OWNER",
-                    "type": "str",
-                },
-                "repo": {
-                    "default": None,
-                    "env_var": "GH_REPO_NAME",
-                    "type": "str",
-                },
-            },
-            "issue": {
-                "body": {
-                    "default": "Created via GH Project Manager MCP",
-                    "env_var": "GH_ISSUE_BODY",
-                    "type": "str",
-                },
-                "assignee": {
-                    "default": "@me",
-                    "env_var": "GH_ISSUE_ASSIGNEE",
-                    "type": "str",
-                },
-                "labels": {"default": [], "env_var": "GH_ISSUE_LABELS", "type": "list"},
-                "project": {
-                    "default": None,
-                    "env_var": "GH_ISSUE_PROJECT",
-                    "type": "str",
-                },
-                "issue_list_limit": {
-                    "default": 100,
-                    "env_var": "GH_ISSUE_LIST_LIMIT",
-                    "type": "int",
-                },
-            },
-            # Add pull_request category with approved parameters
-            "pull_request": {
-                "body": {
-                    "default": "Created via GH Project Manager MCP",
-                    "env_var": "GH_PR_BODY",
-                    "type": "str",
-                },
-                "assignee": {
-                    "default": "@me",
-                    "env_var": "GH_PR_ASSIGNEE",
-                    "type": "str",
-                },
-                "base": {
-                    "default": "main",
-                    "env_var": "GH_PR_BASE_BRANCH",
-                    "type": "str",
-                },
-            },
-            # Add project category with all parameters used in projects.py
-            "project": {
-                "project_id": {
-                    "default": None,
-                    "env_var": "GH_PROJECT_ID",
-                    "type": "str",
-                },
-                "project_node_id": {
-                    "default": None,
-                    "env_var": "GH_PROJECT_NODE_ID",
-                    "type": "str",
-                },
-                "field_list_limit": {
-                    "default": 100,
-                    "env_var": "GH_PROJECT_FIELD_LIST_LIMIT",
-                    "type": "int",
-                },
-                "item_list_limit": {
-                    "default": 100,
-                    "env_var": "GH_PROJECT_ITEM_LIST_LIMIT",
-                    "type": "int",
-                },
-            },
-        }
+        resolved: Dict[Tuple[str, str], Any] = {}
+        # Read each env var once from a single local binding
+        env = os.environ
 
         # Initialize configuration with defaults and environment overrides
-        for category, params in defaults.items():
-            self._config[category] = {}
-
+        for category, params in PARAM_DEFAULTS.items():
             for param_name, config in params.items():
                 # Start with default value
                 value: Any = config["default"]
 
                 # Override with environment variable if present
-                if config.get("env_var") and config["env_var"] in os.environ:
-                    env_value: str = os.environ[config["env_var"]]
+                env_var = config.get("env_var")
+                env_value: Optional[str] = env.get(env_var) if env_var else None
+                if env_value is not None:
                     param_type: str = config.get("type", "str")
 
+                    converter = _CONVERTERS.get(param_type)
+                    if converter is None:
+                        # Default to string if type not recognized
+                        logger.warning(
+                            "Unknown parameter type: %s, using as string",
+                            param_type,
+                        )
+                        converter = str
+
                     try:
-                        # Convert value based on type
-                        if param_type == "list" and isinstance(env_value, str):
-                            value = [
-                                item.strip()
-                                for item in env_value.split(",")
-                                if item.strip()
-                            ]
-                        elif param_type == "int" and isinstance(env_value, str):
-                            value = int(env_value)
-                        elif param_type == "bool" and isinstance(env_value, str):
-                            value = env_value.lower() in ("true", "yes", "1", "t", "y")
-                        elif param_type == "str":
-                            value = env_value
-                        else:
-                            # Default to string if type not recognized
-                            print_stderr(
-                                f"WARNING: Unknown parameter type: {param_type}, using as string"
-                            )
-                            value = env_value
+                        value = converter(env_value)
                     except (ValueError, TypeError) as e:
                         # Log the error but continue with default value
-                        print_stderr(
-                            f"ERROR: Failed to convert env var {config['env_var']} "
-                            f"value '{env_value}' to type {param_type}: {str(e)}"
+                        logger.error(
+                            "Failed to convert env var %s value '%s' to type %s: %s. "
+                            "Using default value: %s",
+                            env_var,
+                            env_value,
+                            param_type,
+                            e,
+                            value,
                         )
-                        print_stderr(f"Using default value: {value}")
 
                 # Store the resolved value
-                self._config[category][param_name] = value
+                resolved[(category, param_name)] = value
 
+        self._config = MappingProxyType(resolved)
+        self._categories = frozenset(PARAM_DEFAULTS)
         self._initialized = True
 
     def get_value(self, category: str, param_name: str) -> Any:
@@ -172,36 +211,46 @@ class ConfigStore:
             ApplicationError: If category or parameter doesn't exist
 
         """
-        print_stderr(
-            f"CONFIG: Attempting to get param '{param_name}' from category '{category}'"
+        logger.debug(
+            "Attempting to get param '%s' from category '%s'", param_name, category
         )
 
         if not self._initialized:
             self.initialize()
 
-        if category not in self._config:
-            error = Error.config_param_not_found(
-                param=category,
-                category=category,
-            )
-            raise ApplicationError(error)
+        try:
+            return self._config[(category, param_name)]
+        except KeyError:
+            pass
 
-        if param_name not in self._config[category]:
+        if category not in self._categories:
             error = Error.config_param_not_found(
-                param=param_name,
+                param=category,
                 category=category,
             )
             raise ApplicationError(error)
 
-        value = self._config[category][param_name]
-
-        return value
+        error = Error.config_param_not_found(
+            param=param_name,
+            category=category,
+        )
+        raise ApplicationError(error)
 
 
 # Create singleton instance of the ConfigStore
 config_store = ConfigStore()
 
 
+@functools.lru_cache(maxsize=256)
+def _config_value(category: str, param_name: str) -> Any:
+    """Return a parameter's configured value, looked up once per process.
+
+    Configuration is fixed once the store is initialized, so the lookup is
+    cached; call ``_config_value.cache_clear()`` after changing the store.
+    """
+    return config_store.get_value(category, param_name)
+
+
 def resolve_param(
     category: str, param_name: str, runtime_value: Optional[Any] = None
 ) -> Any:
@@ -230,4 +279,4 @@ def resolve_param(
     if runtime_value is not None:
         return runtime_value
 
-    return config_store.get_value(category, param_name)
+    return _config_value(category, param_name)
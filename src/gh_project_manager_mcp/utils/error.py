@@ -1,11 +1,14 @@
 """Handle errors for the GitHub Project Manager MCP server."""
 
+import logging
 import traceback
 from enum import Enum
 from typing import Any, Dict, Optional
 
 from result import Err, Ok, Result
 
+logger = logging.getLogger(__name__)
+
 
 class ErrorCode(Enum):
     """Define error codes for the application."""
@@ -209,11 +212,28 @@ class Error:
         return cls(
             code=ErrorCode.GH_UNEXPECTED_ERROR,
             exception=exception,
-            details={"traceback": traceback.format_exc()},
+            details=traceback_details(),
             format_args={"message": str(exception) or "An unexpected error occurred"},
         )
 
 
+def traceback_details() -> Optional[Dict[str, Any]]:
+    """Return the exception being handled as error details, when debugging.
+
+    Tracebacks are only formatted when DEBUG logging is enabled (e.g. with
+    MCP_LOG_LEVEL=DEBUG), so regular error responses skip the formatting
+    cost and don't expose server file paths.
+
+    Returns
+    -------
+        Optional[Dict[str, Any]]: ``{"traceback": ...}``, or None
+
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return None
+    return {"traceback": traceback.format_exc()}
+
+
 class ApplicationError(Exception):
     """Wrap our Error object for application-wide error handling."""
 
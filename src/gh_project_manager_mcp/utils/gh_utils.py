@@ -1,26 +1,87 @@
 # src/gh_project_manager_mcp/utils/gh_utils.py
 """Utilities for interacting with the GitHub CLI (`gh`)."""
 
+import asyncio
+import functools
+import inspect
+import logging
+import os
+import shutil
 import subprocess
 import sys
-import traceback
-from typing import List
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from result import Err, Ok, Result
 
-from gh_project_manager_mcp.utils.error import ApplicationError, Error, ErrorCode
+from gh_project_manager_mcp.utils.config import resolve_param
+from gh_project_manager_mcp.utils.error import (
+    ApplicationError,
+    Error,
+    ErrorCode,
+    traceback_details,
+)
+
+logger = logging.getLogger(__name__)
 
 # Constants
 DEFAULT_ERROR_MESSAGE = "An unknown error occurred during GitHub CLI operation"
+# Environment variables holding the GitHub token, in order of precedence
+TOKEN_ENV_VARS = ("GITHUB_TOKEN", "GH_TOKEN")
+# Upper bound on gh processes run at once by execute_gh_commands, across all
+# tool calls sharing the process
+MAX_CONCURRENT_GH_COMMANDS = 8
+# Lower bound for commands that modify GitHub, which its secondary rate
+# limits restrict more tightly than reads
+MAX_CONCURRENT_GH_WRITES = 5
+# Size at which expired read cache entries are pruned
+_READ_CACHE_MAX_ENTRIES = 256
 
 # Export the public functions
 __all__ = [
+    "as_csv",
     "execute_gh_command",
+    "execute_gh_command_cached",
+    "execute_gh_commands",
+    "invalidate_read_cache",
+    "get_github_token",
     "print_stderr",
+    "repo_slug",
+    "require_repo",
+    "run_in_thread",
 ]
 
 _original_print = print
 
+# gh stderr fragments meaning the requested resource doesn't exist
+_NOT_FOUND_MARKERS = ("Could not resolve to a Repository", "HTTP 404")
+# Seconds before an inconclusive repository probe (auth, rate limit, network)
+# is tried again; conclusive probes are kept for the life of the process
+_REPO_PROBE_RETRY_SECONDS = 60.0
+# Repository existence probes: (owner, repo) -> (missing, monotonic expiry)
+_REPO_MISSING: Dict[Tuple[str, str], Tuple[bool, float]] = {}
+
+# Successful read results keyed by command, with the time they were fetched
+_READ_CACHE: Dict[Tuple[str, ...], Tuple[float, Result[str, Error]]] = {}
+# Guards _READ_CACHE, which execute_gh_commands' worker threads share
+_READ_CACHE_LOCK = threading.Lock()
+# Reads currently running, keyed like _READ_CACHE; guarded by _READ_CACHE_LOCK
+_IN_FLIGHT: Dict[Tuple[str, ...], "Future[Result[str, Error]]"] = {}
+# Invalidation counts per slug (None for all repositories); a read started
+# before an invalidation of its repository doesn't cache its result
+_READ_GENERATIONS: Dict[Optional[str], int] = {}
+# Worker threads shared by every execute_gh_commands call; threads are only
+# started once commands are submitted
+_GH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_GH_COMMANDS, thread_name_prefix="gh"
+)
+# Separate, smaller pool for execute_gh_commands(write=True) batches
+_GH_WRITE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_GH_WRITES, thread_name_prefix="gh-write"
+)
+
 
 def print_stderr(*args, **kwargs):
     """Wrap print function to always write to stderr.
@@ -43,12 +104,223 @@ def print_stderr(*args, **kwargs):
     return _original_print(*args, **kwargs)
 
 
-def execute_gh_command(command: List[str]) -> Result[str, Error]:
+def as_csv(value: Any) -> Optional[str]:
+    """Normalize a list-or-scalar parameter to a single gh flag value.
+
+    Lists and tuples are joined with commas, which gh splits back into
+    separate values; anything else is converted with ``str()``.
+
+    Args:
+    ----
+        value: The parameter value, e.g. a label name or a list of labels
+
+    Returns:
+    -------
+        The flag value, or None if the parameter is empty or unset
+
+    """
+    if not value:
+        return None
+    if isinstance(value, (list, tuple)):
+        return ",".join(value)
+    return str(value)
+
+
+@functools.lru_cache(maxsize=1)
+def _gh_executable() -> str:
+    """Return the absolute path of the ``gh`` binary, looked up once.
+
+    An absolute path lets subprocess start ``gh`` with ``posix_spawn`` and
+    skips the PATH search on every call. If ``gh`` isn't found, the bare
+    name is returned so running it still reports GH_CLI_NOT_FOUND.
+    """
+    return shutil.which("gh") or "gh"
+
+
+@functools.lru_cache(maxsize=1)
+def get_github_token() -> Optional[str]:
+    """Return the GitHub token from the environment.
+
+    The lookup is cached for the lifetime of the process; call
+    ``get_github_token.cache_clear()`` after rotating the token.
+
+    Returns
+    -------
+        The value of GITHUB_TOKEN or GH_TOKEN, or None if neither is set.
+
+    """
+    return next(filter(None, map(os.environ.get, TOKEN_ENV_VARS)), None)
+
+
+def repo_slug(
+    owner: Optional[str] = None, repo: Optional[str] = None
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Resolve the repository owner and name and build the ``owner/repo`` slug.
+
+    Underscores in the repository name are replaced with dashes only if
+    GitHub reports that no repository exists under the name as given, since
+    GitHub names may contain either. The answer is remembered per repository.
+
+    Args:
+    ----
+        owner: The repository owner (falls back to GH_REPO_OWNER env var)
+        repo: The repository name (falls back to GH_REPO_NAME env var)
+
+    Returns:
+    -------
+        Tuple of (owner, repo, slug); the slug is None if either part is missing
+
+    """
+    owner_val, repo_val, slug = _resolved_slug(owner, repo)
+
+    if slug is not None and "_" in repo_val and _repo_missing(owner_val, repo_val):
+        return _resolved_slug(owner_val, repo_val.replace("_", "-"))
+
+    return owner_val, repo_val, slug
+
+
+@functools.lru_cache(maxsize=64)
+def _resolved_slug(
+    owner: Optional[str], repo: Optional[str]
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Resolve and format the slug of ``owner/repo`` as given, once per pair."""
+    owner_val = resolve_param("global", "owner", owner)
+    repo_val = resolve_param("global", "repo", repo)
+
+    if owner_val is None or repo_val is None:
+        return owner_val, repo_val, None
+
+    return owner_val, repo_val, f"{owner_val}/{repo_val}"
+
+
+def _repo_missing(owner: str, repo: str) -> bool:
+    """Check whether GitHub reports that ``owner/repo`` doesn't exist.
+
+    A not-found answer or a successful lookup is remembered for good. A probe
+    that fails for any other reason (auth, rate limit, network, missing
+    ``gh``) is inconclusive: the name is kept as given, and probed again
+    only after _REPO_PROBE_RETRY_SECONDS so a throttled GitHub isn't asked
+    on every call.
+    """
+    key = (owner, repo)
+    now = time.monotonic()
+    probe = _REPO_MISSING.get(key)
+    if probe is not None and now < probe[1]:
+        return probe[0]
+
+    result = execute_gh_command(
+        ["repo", "view", f"{owner}/{repo}", "--json", "name"], log_errors=False
+    )
+    if isinstance(result, Ok):
+        _REPO_MISSING[key] = (False, float("inf"))
+    elif _is_not_found(result.err_value):
+        logger.warning(
+            "Repository %s/%s not found, using %s instead",
+            owner,
+            repo,
+            f"{owner}/{repo.replace('_', '-')}",
+        )
+        _REPO_MISSING[key] = (True, float("inf"))
+    else:
+        logger.debug(
+            "Could not check repository %s/%s: %s", owner, repo, result.err_value
+        )
+        _REPO_MISSING[key] = (False, now + _REPO_PROBE_RETRY_SECONDS)
+
+    return _REPO_MISSING[key][0]
+
+
+def _is_not_found(error: Error) -> bool:
+    """Tell whether a failed gh command means the resource doesn't exist."""
+    if error.code != ErrorCode.GH_COMMAND_FAILED:
+        return False
+    stderr = (error.details or {}).get("stderr", "")
+    return any(marker in stderr for marker in _NOT_FOUND_MARKERS)
+
+
+def require_repo(
+    func: Callable[..., Result[Any, Error]],
+) -> Callable[..., Result[Any, Error]]:
+    """Resolve and validate the ``owner`` and ``repo`` arguments of a tool.
+
+    The wrapped function is called with the resolved ``owner`` and ``repo``
+    and the ``owner/repo`` slug as the keyword-only ``slug`` argument. If
+    either part is missing, a required-parameter error is returned without
+    calling it. ``owner`` and ``repo`` must be passed by keyword, as MCP
+    clients do. ``slug`` is left out of the reported signature, so it never
+    shows up in the tool's input schema.
+
+    Args:
+    ----
+        func: The tool function to wrap; it must accept ``slug``
+
+    Returns:
+    -------
+        The wrapped function
+
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(
+        *args: Any, owner: Optional[str] = None, repo: Optional[str] = None, **kwargs
+    ) -> Result[Any, Error]:
+        owner_val, repo_val, slug = repo_slug(owner, repo)
+
+        # Validate required parameters
+        if owner_val is None:
+            return Err(Error.required_param_missing(param="owner"))
+
+        if repo_val is None:
+            return Err(Error.required_param_missing(param="repo"))
+
+        return func(*args, owner=owner_val, repo=repo_val, slug=slug, **kwargs)
+
+    wrapper.__signature__ = signature.replace(
+        parameters=[
+            param for param in signature.parameters.values() if param.name != "slug"
+        ]
+    )
+    return wrapper
+
+
+def run_in_thread(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a blocking tool so the server runs it in a worker thread.
+
+    FastMCP calls synchronous tools directly on the event loop, so a tool
+    waiting on ``gh`` would stall every other request. The returned
+    coroutine function runs ``func`` with ``asyncio.to_thread`` instead,
+    letting concurrent tool calls overlap. Name, docstring and signature
+    are kept, so the tool's description and input schema don't change.
+
+    Args:
+    ----
+        func: The synchronous tool function to wrap
+
+    Returns:
+    -------
+        The wrapped coroutine function
+
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    return wrapper
+
+
+def execute_gh_command(
+    command: List[str], input_text: Optional[str] = None, log_errors: bool = True
+) -> Result[str, Error]:
     """Execute a GitHub CLI command and return a Result object.
 
     Args:
     ----
         command: The command to execute as a list of strings (e.g., ['issue', 'list']).
+        input_text: Text written to the command's stdin, e.g. for ``--body-file -``.
+        log_errors: Whether failures are logged as errors; probes whose
+            failure is an expected answer pass False to log them at debug.
 
     Returns:
     -------
@@ -56,11 +328,20 @@ def execute_gh_command(command: List[str]) -> Result[str, Error]:
         Err(Error) containing error details if the command fails.
 
     """
+    log_error = logger.error if log_errors else logger.debug
+
     try:
-        full_command = ["gh"] + command
+        full_command = [_gh_executable(), *command]
 
+        # Python's own descriptors are non-inheritable, so close_fds adds
+        # nothing here; leaving it off lets subprocess use posix_spawn
         process = subprocess.run(
-            full_command, capture_output=True, text=True, check=False
+            full_command,
+            input=input_text,
+            capture_output=True,
+            text=True,
+            check=False,
+            close_fds=False,
         )
 
         stdout_output = process.stdout.strip()
@@ -70,7 +351,7 @@ def execute_gh_command(command: List[str]) -> Result[str, Error]:
             error_msg = (
                 stderr_output or f"Command failed with exit code {process.returncode}"
             )
-            print_stderr(f"GitHub CLI Error ({process.returncode}): {error_msg}")
+            log_error("GitHub CLI Error (%s): %s", process.returncode, error_msg)
 
             # Create command failed error with the process as the exception
             error = Error(
@@ -84,20 +365,159 @@ def execute_gh_command(command: List[str]) -> Result[str, Error]:
         return Ok(stdout_output)
 
     except FileNotFoundError as e:
-        print_stderr(
-            "Error: 'gh' command not found. Is GitHub CLI installed and in PATH?"
-        )
+        log_error("'gh' command not found. Is GitHub CLI installed and in PATH?")
         error = Error(ErrorCode.GH_CLI_NOT_FOUND, exception=e)
         return Err(error)
     except ApplicationError as e:
-        print_stderr(f"ApplicationError during gh execution: {e}")
+        log_error("ApplicationError during gh execution: %s", e)
         return Err(e.error)
     except Exception as e:
-        print_stderr(f"Unexpected error during gh execution: {e}")
+        log_error("Unexpected error during gh execution: %s", e)
         error = Error(
             ErrorCode.GH_UNEXPECTED_ERROR,
             exception=e,
-            details={"traceback": traceback.format_exc()},
+            details=traceback_details(),
             format_args={"message": str(e)},
         )
         return Err(error)
+
+
+def execute_gh_commands(
+    commands: Sequence[List[str]], cached: bool = False, write: bool = False
+) -> List[Result[str, Error]]:
+    """Execute independent GitHub CLI commands concurrently.
+
+    Each command runs in its own ``gh`` process on a shared thread pool, at
+    most MAX_CONCURRENT_GH_COMMANDS at a time across the whole server, so
+    the total latency is close to that of the slowest command rather than
+    the sum of all of them, without flooding GitHub when several tools fan
+    out at once. Writes use their own pool of MAX_CONCURRENT_GH_WRITES
+    threads to stay within GitHub's secondary rate limits.
+
+    Args:
+    ----
+        commands: The commands to execute, each as a list of strings.
+        cached: Whether the commands are reads that may be served from, and
+            stored in, the execute_gh_command_cached cache.
+        write: Whether the commands modify GitHub and share the write limit.
+
+    Returns:
+    -------
+        One Result per command, in the same order as ``commands``.
+
+    """
+    execute = execute_gh_command_cached if cached else execute_gh_command
+    if len(commands) <= 1:
+        return [execute(command) for command in commands]
+
+    executor = _GH_WRITE_EXECUTOR if write else _GH_EXECUTOR
+    return list(executor.map(execute, commands))
+
+
+def execute_gh_command_cached(
+    command: List[str], ttl: Optional[float] = None
+) -> Result[str, Error]:
+    """Execute a read-only GitHub CLI command, reusing recent results.
+
+    Successful results are kept for ``ttl`` seconds, so repeated reads of the
+    same issue or listing within that window don't start another ``gh``
+    process. Concurrent calls for the same command share a single ``gh``
+    run. Errors are never cached. Tools that modify a repository call
+    invalidate_read_cache() with its slug.
+
+    Args:
+    ----
+        command: The command to execute as a list of strings.
+        ttl: How long, in seconds, a successful result may be reused
+            (falls back to GH_READ_CACHE_TTL env var, 5 by default).
+
+    Returns:
+    -------
+        The same Result execute_gh_command() returns for the command.
+
+    """
+    ttl = resolve_param("global", "read_cache_ttl", ttl)
+    key = tuple(command)
+    now = time.monotonic()
+
+    hit = _READ_CACHE.get(key)
+    if hit is not None and now - hit[0] < ttl:
+        return hit[1]
+
+    # Join a run of the same command that is already in progress
+    with _READ_CACHE_LOCK:
+        in_flight = _IN_FLIGHT.get(key)
+        if in_flight is None:
+            future: "Future[Result[str, Error]]" = Future()
+            _IN_FLIGHT[key] = future
+            generation = _read_generation(key)
+    if in_flight is not None:
+        return in_flight.result()
+
+    # gh runs outside the lock so reads of other commands don't wait on it
+    try:
+        result = execute_gh_command(command)
+    except BaseException as e:
+        with _READ_CACHE_LOCK:
+            _finish_in_flight(key, future)
+        future.set_exception(e)
+        raise
+
+    with _READ_CACHE_LOCK:
+        if isinstance(result, Ok) and _read_generation(key) == generation:
+            if len(_READ_CACHE) >= _READ_CACHE_MAX_ENTRIES:
+                _prune_read_cache(now, ttl)
+            _READ_CACHE[key] = (now, result)
+        _finish_in_flight(key, future)
+    future.set_result(result)
+
+    return result
+
+
+def _read_generation(key: Tuple[str, ...]) -> int:
+    """Count the invalidations that cover a command; call with the lock held."""
+    return _READ_GENERATIONS.get(None, 0) + sum(
+        _READ_GENERATIONS.get(part, 0) for part in key
+    )
+
+
+def _finish_in_flight(key: Tuple[str, ...], future: "Future") -> None:
+    """Unregister a run unless an invalidation already replaced or dropped it."""
+    if _IN_FLIGHT.get(key) is future:
+        del _IN_FLIGHT[key]
+
+
+def _prune_read_cache(now: float, ttl: float) -> None:
+    """Drop expired read cache entries, or all of them if none expired.
+
+    Must be called with _READ_CACHE_LOCK held.
+    """
+    expired = [key for key, (fetched, _) in _READ_CACHE.items() if now - fetched >= ttl]
+    if not expired:
+        _READ_CACHE.clear()
+    for key in expired:
+        _READ_CACHE.pop(key, None)
+
+
+def invalidate_read_cache(slug: Optional[str] = None) -> None:
+    """Forget cached reads of a repository, or of every repository.
+
+    Reads of it still running are detached too: their callers get their
+    result, but it isn't cached and later reads start a fresh ``gh`` run.
+
+    Args:
+    ----
+        slug: The ``owner/repo`` slug whose reads to drop; None drops all.
+
+    """
+    with _READ_CACHE_LOCK:
+        _READ_GENERATIONS[slug] = _READ_GENERATIONS.get(slug, 0) + 1
+        if slug is None:
+            _READ_CACHE.clear()
+            _IN_FLIGHT.clear()
+            return
+
+        for key in [key for key in _READ_CACHE if slug in key]:
+            _READ_CACHE.pop(key, None)
+        for key in [key for key in _IN_FLIGHT if slug in key]:
+            _IN_FLIGHT.pop(key, None)
@@ -1,12 +1,27 @@
 """Handle function results and convert them to JSON responses."""
 
 import functools
+import json
+import logging
 from typing import Any, Callable, Dict, Generic, Protocol, TypeVar
 
 from result import Ok, Result
 
 from gh_project_manager_mcp.utils.error import Error
-from gh_project_manager_mcp.utils.gh_utils import print_stderr
+
+# orjson is an optional extra; decoding gh output falls back to the stdlib
+try:
+    from orjson import JSONDecodeError as _JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - exercised only without the extra
+    _JSONDecodeError = json.JSONDecodeError
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Characters a JSON document can start with: object, array, string, number
+# and the true/false/null literals
+_JSON_START_CHARS = frozenset('{["-0123456789tfn')
 
 T = TypeVar("T")
 E = TypeVar("E")  # Error type
@@ -31,16 +46,15 @@ def _format_success_response(value: Any) -> Dict[str, Any]:
         A standardized JSON-serializable dictionary
 
     """
-    # Check if value is a string that might be JSON
-    if isinstance(value, str):
+    # Only try to decode strings that can start a JSON value; gh mutation
+    # commands print plain URLs, which would just raise
+    if isinstance(value, str) and value.lstrip()[:1] in _JSON_START_CHARS:
         try:
             # Try to parse it as JSON
-            import json
-
-            parsed_value = json.loads(value)
+            parsed_value = _json_loads(value)
             # If parsing succeeds, use the parsed object
             return {"status": "SUCCESS", "raw": parsed_value}
-        except json.JSONDecodeError:
+        except _JSONDecodeError:
             # If it's not valid JSON, use the original string
             pass
 
@@ -107,19 +121,19 @@ def handle_result(func: ResultReturningCallable[T, E]) -> Callable[..., Dict[str
             # Call the original function
             result = func(*args, **kwargs)
 
-            # Process the result
+            # Process the result; read the wrapped value directly instead of
+            # going through unwrap(), which is an extra call per tool invocation
             if isinstance(result, Ok):
                 # Format successful result
-                return _format_success_response(result.unwrap())
+                return _format_success_response(result.ok_value)
             else:  # isinstance(result, Err)
                 # Format error result
-                error_value = result.err_value
-                return _format_error_response(error_value)
+                return _format_error_response(result.err_value)
 
         except Exception as e:
             # Create an Error object from the exception
             error = Error.from_exception(e)
-            print_stderr(f"ERROR in {func.__name__}: {e}")
+            logger.error("ERROR in %s: %s", func.__name__, e)
 
             # Return formatted error
             return _format_error_response(error)
@@ -1,6 +1,8 @@
 # tests/test_server.py
 """Tests for the MCP server entry point and initialization."""
 
+import subprocess
+import sys
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
@@ -258,4 +260,134 @@ async def test_main_initializes_server(mocker: "MockerFixture") -> None:
     assert result == mock_server_instance
 
 
+def test_server_import_is_lazy() -> None:
+    """Test importing the server module doesn't load the MCP SDK.
+
+    Given: A fresh interpreter
+    When: gh_project_manager_mcp.server is imported
+    Then: The MCP SDK, anyio and the tool modules are not loaded yet
+    """
+    # Given
+    code = (
+        "import sys; import gh_project_manager_mcp.server; "
+        "print(any(m in sys.modules for m in ("
+        "'mcp.server.fastmcp', 'anyio', 'gh_project_manager_mcp.tools.issues')))"
+    )
+
+    # When
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    # Then
+    assert output.strip() == "False"
+
+
+def test_create_server_registers_every_tool_module(mocker: "MockerFixture") -> None:
+    """Test create_server calls init_tools for each listed tool module.
+
+    Given: The init_tools function of every tool module is mocked
+    When: create_server() is called
+    Then: Each module listed by list_capabilities() registers with the server
+    """
+    # Given
+    from gh_project_manager_mcp.server import create_server, list_capabilities
+
+    mocks = {
+        name: mocker.patch(f"gh_project_manager_mcp.tools.{name}.init_tools")
+        for name in list_capabilities()
+    }
+    create_server.cache_clear()
+
+    # When
+    server = create_server()
+
+    # Then
+    assert set(mocks) == {"issues", "projects", "pull_requests"}
+    for mock_init in mocks.values():
+        mock_init.assert_called_once_with(server)
+    create_server.cache_clear()
+
+
+def test_create_server_reuses_instance(mocker: "MockerFixture") -> None:
+    """Test create_server builds the server once per process.
+
+    Given: The tool registrations are mocked and the cache is empty
+    When: create_server() is called twice
+    Then: The same instance is returned and tools are registered once
+    """
+    # Given
+    from gh_project_manager_mcp.server import create_server
+
+    mock_init = mocker.patch("gh_project_manager_mcp.tools.issues.init_tools")
+    create_server.cache_clear()
+
+    # When
+    first = create_server()
+    second = create_server()
+
+    # Then
+    assert first is second
+    mock_init.assert_called_once_with(first)
+    create_server.cache_clear()
+
+
+@pytest.mark.parametrize("uvloop_installed", [True, False])
+def test_main_uses_uvloop_when_installed(
+    mocker: "MockerFixture", uvloop_installed: bool
+) -> None:
+    """Test main only runs on a uvloop event loop when uvloop is importable.
+
+    Given: uvloop is or isn't installed
+    When: main() is called
+    Then: asyncio.Runner gets uvloop's loop factory or the default one
+    """
+    # Given
+    from gh_project_manager_mcp.server import main
+
+    mock_uvloop = MagicMock()
+    mocker.patch.dict(sys.modules, {"uvloop": mock_uvloop})
+    mocker.patch(
+        "importlib.util.find_spec",
+        return_value=MagicMock() if uvloop_installed else None,
+    )
+    mock_runner = mocker.patch("asyncio.Runner")
+    mocker.patch("gh_project_manager_mcp.server.run_async", new=MagicMock())
+
+    # When
+    main()
+
+    # Then
+    expected_factory = mock_uvloop.new_event_loop if uvloop_installed else None
+    mock_runner.assert_called_once_with(loop_factory=expected_factory)
+    mock_runner.return_value.__enter__.return_value.run.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_run_async_logs_missing_token(
+    mocker: "MockerFixture", caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a missing token is reported through the logger before exiting.
+
+    Given: No GitHub token is available
+    When: run_async() is awaited
+    Then: An error is logged and the process exits with status 1
+    """
+    # Given
+    from gh_project_manager_mcp.server import run_async
+
+    mocker.patch("gh_project_manager_mcp.server.get_github_token", return_value=None)
+
+    # When
+    with pytest.raises(SystemExit) as exc_info:
+        await run_async()
+
+    # Then
+    assert exc_info.value.code == 1
+    assert any(
+        record.levelname == "ERROR" and "GitHub token not found" in record.message
+        for record in caplog.records
+    )
+
+
 # Add other tests for server functionality as needed
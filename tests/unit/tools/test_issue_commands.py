@@ -0,0 +1,328 @@
+"""Unit tests for the gh command lines built by the issue tools."""
+
+import time
+from typing import TYPE_CHECKING, Any, Dict, List
+
+import pytest
+from result import Err, Ok
+
+from gh_project_manager_mcp.tools import issues
+from gh_project_manager_mcp.utils import gh_utils
+from gh_project_manager_mcp.utils.error import Error, ErrorCode
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def mock_gh(mocker: "MockerFixture"):
+    """Mock the cached and uncached gh executors in the issues module."""
+    mock = mocker.patch.object(issues, "execute_gh_command", return_value=Ok(""))
+    mocker.patch.object(issues, "execute_gh_command_cached", new=mock)
+    return mock
+
+
+@pytest.mark.parametrize(
+    "tool, kwargs, expected",
+    [
+        (
+            "create_issue",
+            {
+                "title": "Bug",
+                "owner": "octocat",
+                "repo": "hello-world",
+                "body": "Details",
+                "assignee": "monalisa",
+                "labels": ["bug", "ui"],
+                "project": "Roadmap",
+            },
+            [
+                "issue", "create", "-R", "octocat/hello-world",
+                "--title", "Bug",
+                "--body", "Details",
+                "--assignee", "monalisa",
+                "--label", "bug,ui",
+                "--project", "Roadmap",
+            ],
+        ),
+        (
+            "list_issues",
+            {
+                "limit": 5,
+                "owner": "octocat",
+                "repo": "hello",
+                "state": "open",
+                "creator": "monalisa",
+                "labels": ["bug", "ui"],
+            },
+            [
+                "issue", "list",
+                "--json", "number,title,state,url,createdAt,updatedAt,labels,assignees",
+                "--repo", "octocat/hello",
+                "--state", "open",
+                "--author", "monalisa",
+                "--label", "bug,ui",
+                "--limit", "5",
+            ],
+        ),
+        (
+            "edit_issue",
+            {
+                "issue_identifier": "7",
+                "owner": "octocat",
+                "repo": "hello",
+                "title": "New title",
+                "add_assignees": ["a", "b"],
+                "remove_labels": "wontfix",
+                "milestone": 3,
+            },
+            [
+                "issue", "edit", "7", "--repo", "octocat/hello",
+                "--title", "New title",
+                "--add-assignee", "a,b",
+                "--remove-label", "wontfix",
+                "--milestone", "3",
+            ],
+        ),
+    ],
+)  # fmt: skip
+def test_command_includes_only_given_flags(
+    mock_gh, tool: str, kwargs: Dict[str, Any], expected: List[str]
+) -> None:
+    """Test each tool passes only the flags it was given, in order.
+
+    Given: An issue tool called with a subset of its optional parameters
+    When: The tool runs
+    Then: gh is invoked with those flags and list values joined as gh expects
+    """
+    # When
+    response = getattr(issues, tool)(**kwargs)
+
+    # Then
+    assert response["status"] == "SUCCESS"
+    mock_gh.assert_called_once_with(expected)
+
+
+class TestGetIssues:
+    """Tests for get_issues."""
+
+    def test_combines_issues_into_one_list(self, mocker: "MockerFixture") -> None:
+        """Test each issue is viewed and the results form one JSON list.
+
+        Given: Two issue numbers
+        When: get_issues is called
+        Then: One view command per issue runs and both issues are returned
+        """
+        # Given
+        mock_execute = mocker.patch.object(
+            issues,
+            "execute_gh_commands",
+            return_value=[Ok('{"number": 1}'), Ok('{"number": 2}')],
+        )
+
+        # When
+        response = issues.get_issues([1, 2], owner="octocat", repo="hello")
+
+        # Then
+        assert response == {"status": "SUCCESS", "raw": [{"number": 1}, {"number": 2}]}
+        commands = mock_execute.call_args[0][0]
+        assert mock_execute.call_args.kwargs == {"cached": True}
+        assert [command[2] for command in commands] == ["1", "2"]
+        assert all(command[-2:] == ["--repo", "octocat/hello"] for command in commands)
+
+    def test_returns_first_error(self, mocker: "MockerFixture") -> None:
+        """Test a failed view is returned instead of a partial list.
+
+        Given: The second issue cannot be viewed
+        When: get_issues is called
+        Then: The error of that command is returned
+        """
+        # Given
+        error = Error(ErrorCode.GH_COMMAND_FAILED, format_args={"reason": "not found"})
+        mocker.patch.object(
+            issues,
+            "execute_gh_commands",
+            return_value=[Ok('{"number": 1}'), Err(error)],
+        )
+
+        # When
+        response = issues.get_issues([1, 2], owner="octocat", repo="hello")
+
+        # Then
+        assert response["status"] == "FAILED"
+        assert response["code"] == ErrorCode.GH_COMMAND_FAILED.name
+
+
+class TestBatchEditIssues:
+    """Tests for batch_edit_issues."""
+
+    def test_edits_run_in_one_write_batch(self, mocker: "MockerFixture") -> None:
+        """Test each edit becomes one command and outputs keep the edit order.
+
+        Given: Edits of three issues that finish in reverse order
+        When: batch_edit_issues is called
+        Then: The outputs follow the edits and the cache is dropped once
+        """
+
+        # Given
+        def edit(command):
+            time.sleep(0.01 * (3 - int(command[2])))
+            return Ok(f"https://github.com/octocat/hello/issues/{command[2]}")
+
+        mocker.patch.object(gh_utils, "execute_gh_command", side_effect=edit)
+        mock_invalidate = mocker.patch.object(issues, "invalidate_read_cache")
+        edits = [
+            {"issue_identifier": "1", "add_labels": ["bug", "ui"]},
+            {"issue_identifier": 2, "title": "New title"},
+            {"issue_identifier": "3", "milestone": 4},
+        ]
+
+        # When
+        response = issues.batch_edit_issues(edits, owner="octocat", repo="hello")
+
+        # Then
+        assert response == {
+            "status": "SUCCESS",
+            "raw": [
+                f"https://github.com/octocat/hello/issues/{number}"
+                for number in (1, 2, 3)
+            ],
+        }
+        mock_invalidate.assert_called_once_with("octocat/hello")
+
+    def test_commands_match_edit_issue(self, mocker: "MockerFixture") -> None:
+        """Test a batched edit runs the same command as edit_issue.
+
+        Given: One edit with several fields
+        When: batch_edit_issues is called
+        Then: The write batch holds edit_issue's command for it
+        """
+        # Given
+        mock_execute = mocker.patch.object(
+            issues, "execute_gh_commands", return_value=[Ok("")]
+        )
+        edit = {"issue_identifier": "7", "add_assignees": ["a", "b"], "milestone": 3}
+
+        # When
+        issues.batch_edit_issues([edit], owner="octocat", repo="hello")
+
+        # Then
+        mock_execute.assert_called_once_with(
+            [
+                ["issue", "edit", "7", "--repo", "octocat/hello",
+                 "--add-assignee", "a,b", "--milestone", "3"]
+            ],
+            write=True,
+        )  # fmt: skip
+
+    def test_returns_first_error(self, mocker: "MockerFixture") -> None:
+        """Test a failed edit is returned and the cache is still dropped.
+
+        Given: The second of three edits fails
+        When: batch_edit_issues is called
+        Then: The error of that edit is returned after invalidating the cache
+        """
+        # Given
+        error = Error(ErrorCode.GH_COMMAND_FAILED, format_args={"reason": "denied"})
+        mocker.patch.object(
+            issues,
+            "execute_gh_commands",
+            return_value=[Ok("1"), Err(error), Ok("3")],
+        )
+        mock_invalidate = mocker.patch.object(issues, "invalidate_read_cache")
+        edits = [{"issue_identifier": str(number)} for number in (1, 2, 3)]
+
+        # When
+        response = issues.batch_edit_issues(edits, owner="octocat", repo="hello")
+
+        # Then
+        assert response["status"] == "FAILED"
+        assert response["code"] == ErrorCode.GH_COMMAND_FAILED.name
+        mock_invalidate.assert_called_once_with("octocat/hello")
+
+    @pytest.mark.parametrize(
+        "edits, param", [([], "edits"), ([{"title": "x"}], "issue_identifier")]
+    )
+    def test_requires_edits_with_issue(
+        self, mock_gh, edits: List[Dict[str, Any]], param: str
+    ) -> None:
+        """Test missing edits or issue identifiers are rejected without gh.
+
+        Given: No edits, or an edit without an issue identifier
+        When: batch_edit_issues is called
+        Then: A REQUIRED_PARAM_MISSING error names the missing parameter
+        """
+        # When
+        response = issues.batch_edit_issues(edits, owner="octocat", repo="hello")
+
+        # Then
+        assert response["code"] == ErrorCode.REQUIRED_PARAM_MISSING.name
+        assert f"'{param}'" in response["message"]
+        mock_gh.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "reason, expected_reason",
+    [("not planned", "not planned"), ("Completed", "completed")],
+)
+def test_close_issue_normalizes_reason(
+    mock_gh, reason: str, expected_reason: str
+) -> None:
+    """Test valid close reasons are passed to gh in lowercase.
+
+    Given: A valid close reason in any case
+    When: close_issue is called
+    Then: gh receives the lowercase reason
+    """
+    # When
+    issues.close_issue("7", owner="octocat", repo="hello", reason=reason)
+
+    # Then
+    mock_gh.assert_called_once_with(
+        ["issue", "close", "7", "--repo", "octocat/hello", "--reason", expected_reason]
+    )
+
+
+def test_close_issue_rejects_unknown_reason(mock_gh) -> None:
+    """Test an unknown close reason is rejected before calling gh.
+
+    Given: A reason gh doesn't accept
+    When: close_issue is called
+    Then: An INVALID_PARAM error listing the valid reasons is returned
+    """
+    # When
+    response = issues.close_issue("7", owner="octocat", repo="hello", reason="Stale")
+
+    # Then
+    assert response["code"] == ErrorCode.INVALID_PARAM.name
+    assert response["message"] == (
+        "Invalid parameter 'Stale'. Must be one of: completed, not planned, duplicate"
+    )
+    mock_gh.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected_flag, expected_input",
+    [
+        ({"body": "Looks good"}, ["--body-file", "-"], "Looks good"),
+        ({"body_file": "notes.md"}, ["--body-file", "notes.md"], None),
+    ],
+)
+def test_comment_issue_pipes_inline_body(
+    mock_gh, kwargs: Dict[str, Any], expected_flag: List[str], expected_input: Any
+) -> None:
+    """Test an inline comment body is sent over stdin instead of argv.
+
+    Given: A comment given either inline or as a file path
+    When: comment_issue is called
+    Then: An inline body is piped to gh and a file path is passed through
+    """
+    # When
+    response = issues.comment_issue("7", owner="octocat", repo="hello", **kwargs)
+
+    # Then
+    assert response["status"] == "SUCCESS"
+    mock_gh.assert_called_once_with(
+        ["issue", "comment", "7", "--repo", "octocat/hello", *expected_flag],
+        input_text=expected_input,
+    )
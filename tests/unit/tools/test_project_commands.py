@@ -0,0 +1,106 @@
+"""Unit tests for the gh command lines built by the project tools."""
+
+from typing import TYPE_CHECKING
+
+from result import Err, Ok
+
+from gh_project_manager_mcp.tools import projects
+from gh_project_manager_mcp.utils.error import Error, ErrorCode
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+class TestAddProjectItems:
+    """Tests for add_project_items."""
+
+    def test_adds_each_url_in_one_batch(self, mocker: "MockerFixture") -> None:
+        """Test each URL is added and the results form one JSON list.
+
+        Given: Two issue URLs
+        When: add_project_items is called
+        Then: One item-add command per URL runs in a single batch
+        """
+        # Given
+        mock_execute = mocker.patch.object(
+            projects,
+            "execute_gh_commands",
+            return_value=[Ok('{"id": "A"}'), Ok('{"id": "B"}')],
+        )
+        urls = [
+            "https://github.com/octocat/hello/issues/1",
+            "https://github.com/octocat/hello/issues/2",
+        ]
+
+        # When
+        response = projects.add_project_items(urls, project_id="7", owner="octocat")
+
+        # Then
+        assert response == {"status": "SUCCESS", "raw": [{"id": "A"}, {"id": "B"}]}
+        mock_execute.assert_called_once_with(
+            [
+                ["project", "item-add", "7", "--format", "json",
+                 "--owner", "octocat", "--url", url]
+                for url in urls
+            ],
+            write=True,
+        )  # fmt: skip
+
+    def test_returns_first_error(self, mocker: "MockerFixture") -> None:
+        """Test a failed add is returned instead of a partial list.
+
+        Given: The second item cannot be added
+        When: add_project_items is called
+        Then: The error of that command is returned
+        """
+        # Given
+        error = Error(ErrorCode.GH_COMMAND_FAILED, format_args={"reason": "denied"})
+        mocker.patch.object(
+            projects,
+            "execute_gh_commands",
+            return_value=[Ok('{"id": "A"}'), Err(error)],
+        )
+
+        # When
+        response = projects.add_project_items(
+            ["https://a", "https://b"], project_id="7", owner="octocat"
+        )
+
+        # Then
+        assert response["status"] == "FAILED"
+        assert response["code"] == ErrorCode.GH_COMMAND_FAILED.name
+
+    def test_requires_urls(self) -> None:
+        """Test an empty URL list is rejected without running gh.
+
+        Given: No URLs
+        When: add_project_items is called
+        Then: A REQUIRED_PARAM_MISSING error for urls is returned
+        """
+        # When
+        response = projects.add_project_items([], project_id="7", owner="octocat")
+
+        # Then
+        assert response["code"] == ErrorCode.REQUIRED_PARAM_MISSING.name
+        assert "'urls'" in response["message"]
+
+    def test_requires_project_id(self, mocker: "MockerFixture") -> None:
+        """Test a missing project ID is rejected without running gh.
+
+        Given: No project ID given or configured
+        When: add_project_items is called
+        Then: A REQUIRED_PARAM_MISSING error for project_id is returned
+        """
+        # Given
+        mocker.patch.object(
+            projects, "resolve_param", side_effect=lambda category, name, value: value
+        )
+        mock_execute = mocker.patch.object(projects, "execute_gh_commands")
+
+        # When
+        response = projects.add_project_items(["https://a"], owner="octocat")
+
+        # Then
+        assert response["code"] == ErrorCode.REQUIRED_PARAM_MISSING.name
+        assert "'project_id'" in response["message"]
+        mock_execute.assert_not_called()
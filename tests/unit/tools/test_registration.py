@@ -0,0 +1,49 @@
+"""Unit tests for the tool modules' init_tools registration."""
+
+import inspect
+from unittest.mock import MagicMock
+
+from gh_project_manager_mcp.tools import issues, projects
+
+
+def test_projects_registers_every_table_entry() -> None:
+    """Test projects.init_tools registers each tool, resource and prompt once.
+
+    Given: A mocked server
+    When: projects.init_tools is called
+    Then: Every entry of the registration tables is registered with the server,
+        tools wrapped to run off the event loop
+    """
+    # Given
+    server = MagicMock()
+
+    # When
+    projects.init_tools(server)
+
+    # Then
+    registered_tools = [c.args[0] for c in server.tool.return_value.call_args_list]
+    assert all(inspect.iscoroutinefunction(tool) for tool in registered_tools)
+    assert [tool.__wrapped__ for tool in registered_tools] == list(projects._TOOLS)
+    assert [c.args[0] for c in server.resource.call_args_list] == [
+        uri for uri, _ in projects._RESOURCES
+    ]
+    assert [c.args[0] for c in server.prompt.return_value.call_args_list] == list(
+        projects._PROMPTS
+    )
+
+
+def test_issues_registers_nothing_yet() -> None:
+    """Test the issue tools stay unregistered.
+
+    Given: A mocked server
+    When: issues.init_tools is called
+    Then: No tool is registered
+    """
+    # Given
+    server = MagicMock()
+
+    # When
+    issues.init_tools(server)
+
+    # Then
+    server.tool.assert_not_called()
@@ -0,0 +1,82 @@
+"""Unit tests for the diagnostic helpers in the tools package."""
+
+import json
+from types import SimpleNamespace
+
+from gh_project_manager_mcp.tools import discover_tools, tool_registry_info
+
+
+class TestToolRegistryInfo:
+    """Tests for tool_registry_info."""
+
+    def test_lists_handlers_of_given_server(self) -> None:
+        """Test the handlers of the server passed in are reported.
+
+        Given: A server exposing one tool handler
+        When: tool_registry_info is called with it
+        Then: The handler is listed with its signature
+        """
+        # Given
+        def create_issue(title: str, owner: str = None) -> None:
+            pass
+
+        server = SimpleNamespace(
+            _mcp_server=SimpleNamespace(_tool_handlers={"create_issue": create_issue})
+        )
+
+        # When
+        info = tool_registry_info(server)
+
+        # Then
+        assert info["discovery"] == {
+            "server_found": True,
+            "handlers_found": True,
+            "handler_count": 1,
+        }
+        assert info["registered_tools"][0] == {
+            "name": "create_issue",
+            "function": str(create_issue),
+            "signature": "(title: str, owner: str = None) -> None",
+        }
+        json.dumps(info)
+
+    def test_reports_missing_handlers(self) -> None:
+        """Test a server without a handler table is reported, not raised.
+
+        Given: An object without the FastMCP handler attributes
+        When: tool_registry_info is called with it
+        Then: The error is recorded and no tools are listed
+        """
+        # Given
+        server = SimpleNamespace()
+
+        # When
+        info = tool_registry_info(server)
+
+        # Then
+        assert info == {
+            "discovery": {"error": "handlers not found"},
+            "registered_tools": [],
+        }
+
+
+class TestDiscoverTools:
+    """Tests for discover_tools."""
+
+    def test_lists_public_module_functions(self) -> None:
+        """Test only functions defined in the tools package are listed.
+
+        Given: The tools package is imported
+        When: discover_tools is called
+        Then: Its module level functions are listed and no tools are reported
+        """
+        # When
+        info = discover_tools()
+
+        # Then
+        assert info == {
+            "discovery": {
+                "module_functions": ["tool_registry_info", "discover_tools"],
+            },
+            "registered_tools": [],
+        }
@@ -0,0 +1,158 @@
+"""Unit tests for the configuration store."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from gh_project_manager_mcp.utils.config import (
+    ConfigStore,
+    _config_value,
+    config_store,
+    resolve_param,
+)
+from gh_project_manager_mcp.utils.error import ApplicationError, ErrorCode
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock import MockerFixture
+
+
+class TestConfigStore:
+    """Tests for ConfigStore value resolution."""
+
+    def test_defaults_are_used_without_env(self, monkeypatch: "MonkeyPatch") -> None:
+        """Test defaults are returned when no env var is set.
+
+        Given: GH_ISSUE_ASSIGNEE is not set
+        When: The issue assignee is requested
+        Then: The configured default is returned
+        """
+        # Given
+        monkeypatch.delenv("GH_ISSUE_ASSIGNEE", raising=False)
+        store = ConfigStore()
+
+        # When
+        value = store.get_value("issue", "assignee")
+
+        # Then
+        assert value == "@me"
+
+    @pytest.mark.parametrize(
+        "env_var, env_value, category, param, expected",
+        [
+            ("GH_ISSUE_LABELS", "bug, ui ,,", "issue", "labels", ["bug", "ui"]),
+            ("GH_ISSUE_LIST_LIMIT", "25", "issue", "issue_list_limit", 25),
+            ("GH_REPO_OWNER", "octocat", "global", "owner", "octocat"),
+            ("GH_READ_CACHE_TTL", "60", "global", "read_cache_ttl", 60),
+        ],
+    )
+    def test_env_overrides_are_converted(
+        self,
+        monkeypatch: "MonkeyPatch",
+        env_var: str,
+        env_value: str,
+        category: str,
+        param: str,
+        expected: object,
+    ) -> None:
+        """Test env overrides are converted to the declared type.
+
+        Given: An env var overriding a parameter
+        When: The parameter is requested
+        Then: The env value converted to the parameter type is returned
+        """
+        # Given
+        monkeypatch.setenv(env_var, env_value)
+        store = ConfigStore()
+
+        # When
+        value = store.get_value(category, param)
+
+        # Then
+        assert value == expected
+
+    def test_invalid_env_value_keeps_default(self, monkeypatch: "MonkeyPatch") -> None:
+        """Test a value that fails conversion falls back to the default.
+
+        Given: GH_ISSUE_LIST_LIMIT is not an integer
+        When: The issue list limit is requested
+        Then: The default limit is returned
+        """
+        # Given
+        monkeypatch.setenv("GH_ISSUE_LIST_LIMIT", "many")
+        store = ConfigStore()
+
+        # When
+        value = store.get_value("issue", "issue_list_limit")
+
+        # Then
+        assert value == 100
+
+    @pytest.mark.parametrize(
+        "category, param, expected_param",
+        [("unknown", "owner", "unknown"), ("issue", "unknown", "unknown")],
+    )
+    def test_missing_param_raises(
+        self, category: str, param: str, expected_param: str
+    ) -> None:
+        """Test unknown categories and parameters raise ApplicationError.
+
+        Given: A category or parameter that isn't configured
+        When: The value is requested
+        Then: ApplicationError with CONFIG_PARAM_NOT_FOUND is raised
+        """
+        # Given
+        store = ConfigStore()
+
+        # When
+        with pytest.raises(ApplicationError) as exc_info:
+            store.get_value(category, param)
+
+        # Then
+        assert exc_info.value.error.code == ErrorCode.CONFIG_PARAM_NOT_FOUND
+        assert f"'{expected_param}'" in exc_info.value.error.message
+
+
+class TestResolveParam:
+    """Tests for resolve_param."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Reset the cached config lookups around each test."""
+        _config_value.cache_clear()
+        yield
+        _config_value.cache_clear()
+
+    def test_runtime_value_wins(self) -> None:
+        """Test a runtime value is returned without touching the config.
+
+        Given: A runtime value for the issue assignee
+        When: resolve_param is called
+        Then: The runtime value is returned
+        """
+        # When
+        value = resolve_param("issue", "assignee", "octocat")
+
+        # Then
+        assert value == "octocat"
+        assert _config_value.cache_info().currsize == 0
+
+    def test_config_value_is_looked_up_once(self, mocker: "MockerFixture") -> None:
+        """Test repeated lookups of the same parameter hit the cache.
+
+        Given: No runtime value
+        When: resolve_param is called twice for the same parameter
+        Then: The config store is queried once
+        """
+        # Given
+        spy = mocker.patch.object(
+            config_store, "get_value", wraps=config_store.get_value
+        )
+
+        # When
+        first = resolve_param("issue", "issue_list_limit")
+        second = resolve_param("issue", "issue_list_limit")
+
+        # Then
+        assert first == second == 100
+        spy.assert_called_once_with("issue", "issue_list_limit")
@@ -0,0 +1,731 @@
+"""Unit tests for the gh_utils helper functions."""
+
+import asyncio
+import inspect
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List
+
+import pytest
+from result import Err, Ok
+
+from gh_project_manager_mcp.utils import gh_utils
+from gh_project_manager_mcp.utils.config import _config_value
+from gh_project_manager_mcp.utils.error import Error, ErrorCode
+from gh_project_manager_mcp.utils.gh_utils import (
+    _resolved_slug,
+    as_csv,
+    execute_gh_command_cached,
+    execute_gh_commands,
+    get_github_token,
+    invalidate_read_cache,
+    repo_slug,
+    require_repo,
+    run_in_thread,
+)
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Reset the cached token before and after each test."""
+    get_github_token.cache_clear()
+    yield
+    get_github_token.cache_clear()
+
+
+class TestGetGithubToken:
+    """Tests for get_github_token."""
+
+    def test_prefers_github_token(self, monkeypatch: "MonkeyPatch") -> None:
+        """Test GITHUB_TOKEN takes precedence over GH_TOKEN.
+
+        Given: Both GITHUB_TOKEN and GH_TOKEN are set
+        When: get_github_token is called
+        Then: The GITHUB_TOKEN value is returned
+        """
+        # Given
+        monkeypatch.setenv("GITHUB_TOKEN", "github-token")
+        monkeypatch.setenv("GH_TOKEN", "gh-token")
+
+        # When
+        token = get_github_token()
+
+        # Then
+        assert token == "github-token"
+
+    def test_falls_back_to_gh_token(self, monkeypatch: "MonkeyPatch") -> None:
+        """Test GH_TOKEN is used when GITHUB_TOKEN is missing.
+
+        Given: Only GH_TOKEN is set
+        When: get_github_token is called
+        Then: The GH_TOKEN value is returned
+        """
+        # Given
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.setenv("GH_TOKEN", "gh-token")
+
+        # When
+        token = get_github_token()
+
+        # Then
+        assert token == "gh-token"
+
+    def test_result_is_cached(self, monkeypatch: "MonkeyPatch") -> None:
+        """Test the token lookup happens once per process.
+
+        Given: A token was already looked up
+        When: The environment changes and get_github_token is called again
+        Then: The cached value is returned until the cache is cleared
+        """
+        # Given
+        monkeypatch.setenv("GITHUB_TOKEN", "first")
+        assert get_github_token() == "first"
+
+        # When
+        monkeypatch.setenv("GITHUB_TOKEN", "second")
+
+        # Then
+        assert get_github_token() == "first"
+        get_github_token.cache_clear()
+        assert get_github_token() == "second"
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (["bug", "ui"], "bug,ui"),
+        (("bug",), "bug"),
+        ("bug", "bug"),
+        (3, "3"),
+        ([], None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_as_csv(value: object, expected: object) -> None:
+    """Test list-or-scalar values are normalized to one flag value.
+
+    Given: A parameter value of any supported shape
+    When: as_csv is called
+    Then: Sequences are comma-joined, scalars stringified, empties dropped
+    """
+    # When
+    result = as_csv(value)
+
+    # Then
+    assert result == expected
+
+
+class TestRepoSlug:
+    """Tests for repo_slug."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Reset the cached slugs, probes and config lookups around each test."""
+        _resolved_slug.cache_clear()
+        gh_utils._REPO_MISSING.clear()
+        _config_value.cache_clear()
+        yield
+        _resolved_slug.cache_clear()
+        gh_utils._REPO_MISSING.clear()
+        _config_value.cache_clear()
+
+    @pytest.mark.parametrize(
+        "missing, expected_repo", [(True, "hello-world"), (False, "hello_world")]
+    )
+    def test_builds_normalized_slug(
+        self, mocker: "MockerFixture", missing: bool, expected_repo: str
+    ) -> None:
+        """Test runtime values are normalized into an owner/repo slug.
+
+        Given: A repository name containing underscores
+        When: repo_slug is called
+        Then: Underscores become dashes only if the name as given doesn't exist
+        """
+        # Given
+        probe = mocker.patch.object(gh_utils, "_repo_missing", return_value=missing)
+
+        # When
+        result = repo_slug("octocat", "hello_world")
+
+        # Then
+        assert result == ("octocat", expected_repo, f"octocat/{expected_repo}")
+        probe.assert_called_once_with("octocat", "hello_world")
+
+    def test_plain_name_is_not_probed(self, mocker: "MockerFixture") -> None:
+        """Test names without underscores are used without checking GitHub.
+
+        Given: A repository name without underscores
+        When: repo_slug is called
+        Then: The name is kept and no gh command runs
+        """
+        # Given
+        probe = mocker.patch.object(gh_utils, "_repo_missing")
+
+        # When
+        result = repo_slug("octocat", "hello-world")
+
+        # Then
+        assert result == ("octocat", "hello-world", "octocat/hello-world")
+        probe.assert_not_called()
+
+    def test_slug_is_resolved_once(self, mocker: "MockerFixture") -> None:
+        """Test repeated calls for one repository reuse the resolved slug.
+
+        Given: A slug that was just resolved
+        When: repo_slug is called again with the same arguments
+        Then: The owner and repo are not resolved a second time
+        """
+        # Given
+        resolve = mocker.patch.object(
+            gh_utils, "resolve_param", side_effect=lambda category, name, value: value
+        )
+        repo_slug("octocat", "hello-world")
+
+        # When
+        result = repo_slug("octocat", "hello-world")
+
+        # Then
+        assert result == ("octocat", "hello-world", "octocat/hello-world")
+        assert resolve.call_count == 2
+
+    @pytest.fixture
+    def clock(self, mocker: "MockerFixture") -> List[float]:
+        """Replace the monotonic clock with one the test advances by hand."""
+        now = [1000.0]
+        mocker.patch.object(gh_utils.time, "monotonic", side_effect=lambda: now[0])
+        return now
+
+    @staticmethod
+    def _probe_error(stderr: str) -> Err:
+        """Build the Err execute_gh_command returns for a failed gh run."""
+        return Err(
+            Error(
+                ErrorCode.GH_COMMAND_FAILED,
+                details={"stdout": "", "stderr": stderr},
+                format_args={"reason": stderr},
+            )
+        )
+
+    def test_not_found_probe_rewrites_for_good(
+        self, mocker: "MockerFixture", clock: List[float]
+    ) -> None:
+        """Test a not-found probe switches to dashes and is never repeated.
+
+        Given: gh reports that the repository as given doesn't exist
+        When: repo_slug is called again, also much later
+        Then: The dashed name is used and gh was asked once, quietly
+        """
+        # Given
+        mock_execute = mocker.patch.object(
+            gh_utils,
+            "execute_gh_command",
+            return_value=self._probe_error(
+                "GraphQL: Could not resolve to a Repository with the name "
+                "'octocat/my_repo'. (repository)"
+            ),
+        )
+        first = repo_slug("octocat", "my_repo")
+
+        # When
+        clock[0] += 24 * 60 * 60
+        second = repo_slug("octocat", "my_repo")
+
+        # Then
+        assert first == second == ("octocat", "my-repo", "octocat/my-repo")
+        mock_execute.assert_called_once_with(
+            ["repo", "view", "octocat/my_repo", "--json", "name"], log_errors=False
+        )
+
+    def test_inconclusive_probe_keeps_name_and_retries_later(
+        self, mocker: "MockerFixture", clock: List[float]
+    ) -> None:
+        """Test a probe failing for another reason keeps the name for a while.
+
+        Given: The repository probe fails with a 502 from GitHub
+        When: repo_slug is called again right away and after the retry delay
+        Then: The name is kept and gh is only asked again after the delay
+        """
+        # Given
+        mock_execute = mocker.patch.object(
+            gh_utils,
+            "execute_gh_command",
+            return_value=self._probe_error(
+                "HTTP 502: Bad Gateway (https://api.github.com/graphql)"
+            ),
+        )
+        first = repo_slug("octocat", "my_repo")
+
+        # When
+        soon = repo_slug("octocat", "my_repo")
+        clock[0] += gh_utils._REPO_PROBE_RETRY_SECONDS
+        later = repo_slug("octocat", "my_repo")
+
+        # Then
+        assert first == soon == later == ("octocat", "my_repo", "octocat/my_repo")
+        assert mock_execute.call_count == 2
+
+    def test_missing_repo_has_no_slug(self, monkeypatch: "MonkeyPatch") -> None:
+        """Test a missing repository yields no slug instead of raising.
+
+        Given: No repository is passed or configured
+        When: repo_slug is called
+        Then: The repository and slug are None
+        """
+        # Given
+        monkeypatch.setattr(
+            "gh_project_manager_mcp.utils.gh_utils.resolve_param",
+            lambda category, name, value: value,
+        )
+
+        # When
+        result = repo_slug("octocat", None)
+
+        # Then
+        assert result == ("octocat", None, None)
+
+
+class TestRequireRepo:
+    """Tests for require_repo."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Reset the cached slugs and repository probes around each test."""
+        _resolved_slug.cache_clear()
+        gh_utils._REPO_MISSING.clear()
+        yield
+        _resolved_slug.cache_clear()
+        gh_utils._REPO_MISSING.clear()
+
+    @staticmethod
+    @require_repo
+    def tool(number: int, owner: str = None, repo: str = None, *, slug: str = None):
+        """Echo the arguments a decorated tool receives."""
+        return Ok((number, owner, repo, slug))
+
+    def test_injects_resolved_repo(self, mocker: "MockerFixture") -> None:
+        """Test the tool receives the normalized owner, repo and slug.
+
+        Given: A tool decorated with require_repo
+        When: It is called with an owner and a repo
+        Then: The resolved values and the slug are passed through
+        """
+        # Given
+        mocker.patch.object(gh_utils, "_repo_missing", return_value=True)
+
+        # When
+        result = self.tool(7, owner="octocat", repo="hello_world")
+
+        # Then
+        assert result.ok_value == (7, "octocat", "hello-world", "octocat/hello-world")
+
+    def test_missing_owner_short_circuits(self, monkeypatch: "MonkeyPatch") -> None:
+        """Test a missing owner is reported without calling the tool.
+
+        Given: No owner is passed or configured
+        When: The decorated tool is called
+        Then: A REQUIRED_PARAM_MISSING error for owner is returned
+        """
+        # Given
+        monkeypatch.setattr(
+            "gh_project_manager_mcp.utils.gh_utils.resolve_param",
+            lambda category, name, value: value,
+        )
+
+        # When
+        result = self.tool(7, repo="hello")
+
+        # Then
+        assert result.err_value.message == "Required parameter 'owner' is missing"
+
+    def test_signature_hides_slug(self) -> None:
+        """Test slug is not part of the signature MCP builds its schema from.
+
+        Given: A tool decorated with require_repo
+        When: Its signature is inspected
+        Then: Only the public parameters are listed
+        """
+        # When
+        params = list(inspect.signature(self.tool).parameters)
+
+        # Then
+        assert params == ["number", "owner", "repo"]
+
+
+class TestRunInThread:
+    """Tests for run_in_thread."""
+
+    @staticmethod
+    def tool(number: int, owner: str = None) -> object:
+        """Report the calling thread."""
+        return number, owner, threading.current_thread()
+
+    def test_runs_tool_in_worker_thread(self) -> None:
+        """Test the wrapped tool runs off the event loop thread.
+
+        Given: A synchronous tool wrapped with run_in_thread
+        When: The wrapper is awaited
+        Then: The tool's result comes from a different thread
+        """
+        # Given
+        wrapped = run_in_thread(self.tool)
+
+        # When
+        number, owner, thread = asyncio.run(wrapped(7, owner="octocat"))
+
+        # Then
+        assert (number, owner) == (7, "octocat")
+        assert thread is not threading.current_thread()
+
+    def test_keeps_tool_metadata(self) -> None:
+        """Test the wrapper keeps what FastMCP builds the tool from.
+
+        Given: A synchronous tool
+        When: It is wrapped with run_in_thread
+        Then: It is a coroutine function with the same name, doc and signature
+        """
+        # When
+        wrapped = run_in_thread(self.tool)
+
+        # Then
+        assert inspect.iscoroutinefunction(wrapped)
+        assert wrapped.__name__ == "tool"
+        assert wrapped.__doc__ == self.tool.__doc__
+        assert inspect.signature(wrapped) == inspect.signature(self.tool)
+
+
+class TestExecuteGhCommand:
+    """Tests for execute_gh_command."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Reset the resolved gh path around each test."""
+        gh_utils._gh_executable.cache_clear()
+        yield
+        gh_utils._gh_executable.cache_clear()
+
+    def test_runs_gh_found_on_path(self, monkeypatch: "MonkeyPatch", tmp_path) -> None:
+        """Test gh is run from its resolved path with stdin input.
+
+        Given: A gh executable on PATH that echoes its arguments and stdin
+        When: execute_gh_command is called with input_text
+        Then: The output shows both, and the resolved path is absolute
+        """
+        # Given
+        gh = tmp_path / "gh"
+        gh.write_text('#!/bin/sh\necho "$@"\ncat\n')
+        gh.chmod(0o755)
+        monkeypatch.setenv("PATH", str(tmp_path), prepend=os.pathsep)
+
+        # When
+        result = gh_utils.execute_gh_command(
+            ["issue", "comment", "7"], input_text="hello"
+        )
+
+        # Then
+        assert result.ok_value == "issue comment 7\nhello"
+        assert gh_utils._gh_executable() == str(gh)
+
+    def test_missing_gh_is_reported(self, monkeypatch: "MonkeyPatch", tmp_path) -> None:
+        """Test a missing gh binary yields GH_CLI_NOT_FOUND.
+
+        Given: No gh executable on PATH
+        When: execute_gh_command is called
+        Then: A GH_CLI_NOT_FOUND error is returned
+        """
+        # Given
+        monkeypatch.setenv("PATH", str(tmp_path))
+
+        # When
+        result = gh_utils.execute_gh_command(["issue", "list"])
+
+        # Then
+        assert result.err_value.code == ErrorCode.GH_CLI_NOT_FOUND
+
+
+class TestExecuteGhCommands:
+    """Tests for execute_gh_commands."""
+
+    def test_results_keep_command_order(self, mocker: "MockerFixture") -> None:
+        """Test results are returned in the order the commands were given.
+
+        Given: Several independent commands
+        When: execute_gh_commands runs them concurrently
+        Then: Each command runs once and results line up with the commands
+        """
+        # Given
+        mock_execute = mocker.patch.object(
+            gh_utils,
+            "execute_gh_command",
+            side_effect=lambda command: Ok(command[-1]),
+        )
+        commands = [["issue", "view", str(number)] for number in range(10)]
+
+        # When
+        results = execute_gh_commands(commands)
+
+        # Then
+        assert [result.ok_value for result in results] == [
+            str(number) for number in range(10)
+        ]
+        assert mock_execute.call_count == 10
+
+    def test_commands_run_on_shared_pool(self, mocker: "MockerFixture") -> None:
+        """Test batches run on the module's shared worker threads.
+
+        Given: Two batches of commands
+        When: execute_gh_commands runs each of them
+        Then: Every command runs on one of the shared gh worker threads
+        """
+        # Given
+        mocker.patch.object(
+            gh_utils,
+            "execute_gh_command",
+            side_effect=lambda command: Ok(threading.current_thread().name),
+        )
+        commands = [["issue", "view", str(number)] for number in range(3)]
+
+        # When
+        results = execute_gh_commands(commands) + execute_gh_commands(commands)
+
+        # Then
+        assert all(result.ok_value.startswith("gh_") for result in results)
+
+    def test_writes_are_capped(self, mocker: "MockerFixture") -> None:
+        """Test write batches never run more than the write limit at once.
+
+        Given: More slow writes than MAX_CONCURRENT_GH_WRITES
+        When: execute_gh_commands runs them with write=True
+        Then: At most MAX_CONCURRENT_GH_WRITES run at the same time
+        """
+        # Given
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def slow_edit(command):
+            with lock:
+                running.append(command)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(command)
+            return Ok(command[2])
+
+        mocker.patch.object(gh_utils, "execute_gh_command", side_effect=slow_edit)
+        commands = [["issue", "edit", str(number)] for number in range(12)]
+
+        # When
+        results = execute_gh_commands(commands, write=True)
+
+        # Then
+        assert [result.ok_value for result in results] == [
+            str(number) for number in range(12)
+        ]
+        assert 1 < max(peak) <= gh_utils.MAX_CONCURRENT_GH_WRITES <= 5
+
+    def test_cached_reads_share_the_read_cache(self, mocker: "MockerFixture") -> None:
+        """Test cached=True serves repeated reads from the read cache.
+
+        Given: An issue view that was just read through the cache
+        When: execute_gh_commands runs it again with cached=True
+        Then: gh is not run a second time for that issue
+        """
+        # Given
+        invalidate_read_cache()
+        mock_execute = mocker.patch.object(
+            gh_utils,
+            "execute_gh_command",
+            side_effect=lambda command: Ok(command[2]),
+        )
+        viewed = ["issue", "view", "1", "--repo", "octocat/hello"]
+        execute_gh_command_cached(viewed)
+
+        # When
+        results = execute_gh_commands(
+            [viewed, ["issue", "view", "2", "--repo", "octocat/hello"]], cached=True
+        )
+
+        # Then
+        assert [result.ok_value for result in results] == ["1", "2"]
+        assert mock_execute.call_count == 2
+        invalidate_read_cache()
+
+
+class TestExecuteGhCommandCached:
+    """Tests for execute_gh_command_cached."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start and end each test with an empty read cache."""
+        invalidate_read_cache()
+        yield
+        invalidate_read_cache()
+
+    @pytest.fixture
+    def mock_execute(self, mocker: "MockerFixture"):
+        """Mock the uncached executor."""
+        return mocker.patch.object(
+            gh_utils, "execute_gh_command", return_value=Ok('{"number": 1}')
+        )
+
+    def test_reuses_recent_result(self, mock_execute) -> None:
+        """Test a repeated read within the TTL doesn't run gh again.
+
+        Given: A read that just succeeded
+        When: The same command is executed again
+        Then: The cached result is returned and gh ran once
+        """
+        # Given
+        command = ["issue", "view", "1", "--repo", "octocat/hello"]
+        first = execute_gh_command_cached(command)
+
+        # When
+        second = execute_gh_command_cached(command)
+
+        # Then
+        assert first is second
+        mock_execute.assert_called_once_with(command)
+
+    def test_expired_result_is_refetched(self, mock_execute) -> None:
+        """Test a zero TTL always runs the command.
+
+        Given: A cached read
+        When: The command is executed with ttl=0
+        Then: gh runs again
+        """
+        # Given
+        command = ["issue", "view", "1", "--repo", "octocat/hello"]
+        execute_gh_command_cached(command)
+
+        # When
+        execute_gh_command_cached(command, ttl=0)
+
+        # Then
+        assert mock_execute.call_count == 2
+
+    def test_configured_ttl_is_used_by_default(
+        self, mock_execute, monkeypatch: "MonkeyPatch"
+    ) -> None:
+        """Test the TTL falls back to the configured read_cache_ttl.
+
+        Given: A configured read cache TTL of zero
+        When: The same command is executed twice without a ttl
+        Then: gh runs both times
+        """
+        # Given
+        monkeypatch.setattr(
+            "gh_project_manager_mcp.utils.gh_utils.resolve_param",
+            lambda category, name, value: 0 if value is None else value,
+        )
+        command = ["issue", "view", "1", "--repo", "octocat/hello"]
+
+        # When
+        execute_gh_command_cached(command)
+        execute_gh_command_cached(command)
+
+        # Then
+        assert mock_execute.call_count == 2
+
+    def test_concurrent_reads_share_one_run(self, mock_execute) -> None:
+        """Test identical reads started together run gh once.
+
+        Given: A slow read
+        When: The same command is executed from several threads at once
+        Then: gh runs once and every caller gets its result
+        """
+
+        # Given
+        def slow_view(command):
+            time.sleep(0.1)
+            return Ok('{"number": 1}')
+
+        mock_execute.side_effect = slow_view
+        command = ["issue", "view", "1", "--repo", "octocat/hello"]
+
+        # When
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(execute_gh_command_cached, [command] * 4, [60] * 4)
+            )
+
+        # Then
+        assert [result.ok_value for result in results] == ['{"number": 1}'] * 4
+        mock_execute.assert_called_once_with(command)
+
+    def test_errors_are_not_cached(self, mock_execute) -> None:
+        """Test a failed read is retried on the next call.
+
+        Given: A read that failed
+        When: The same command is executed again
+        Then: gh runs again
+        """
+        # Given
+        mock_execute.return_value = Err(
+            Error(ErrorCode.GH_COMMAND_FAILED, format_args={"reason": "timeout"})
+        )
+        command = ["issue", "list", "--repo", "octocat/hello"]
+        execute_gh_command_cached(command)
+
+        # When
+        execute_gh_command_cached(command)
+
+        # Then
+        assert mock_execute.call_count == 2
+
+    def test_invalidate_drops_only_that_repository(self, mock_execute) -> None:
+        """Test invalidating a slug keeps reads of other repositories.
+
+        Given: Cached reads of two repositories
+        When: One repository's reads are invalidated
+        Then: Only that repository is fetched again
+        """
+        # Given
+        hello = ["issue", "list", "--repo", "octocat/hello"]
+        world = ["issue", "list", "--repo", "octocat/world"]
+        execute_gh_command_cached(hello)
+        execute_gh_command_cached(world)
+
+        # When
+        invalidate_read_cache("octocat/hello")
+        execute_gh_command_cached(hello)
+        execute_gh_command_cached(world)
+
+        # Then
+        assert mock_execute.call_count == 3
+
+    def test_invalidation_during_read_is_not_overwritten(self, mock_execute) -> None:
+        """Test a read overlapping an invalidation doesn't cache stale data.
+
+        Given: A read of a repository that is invalidated while gh runs
+        When: The same command is executed again
+        Then: The in-flight run was detached and gh runs again for fresh data
+        """
+        # Given
+        command = ["issue", "view", "1", "--repo", "octocat/hello"]
+        key = tuple(command)
+        in_flight_after_invalidate = []
+
+        def edited_while_reading(command):
+            invalidate_read_cache("octocat/hello")
+            in_flight_after_invalidate.append(key in gh_utils._IN_FLIGHT)
+            return Ok('{"title": "old"}')
+
+        responses = iter([edited_while_reading, lambda _: Ok('{"title": "new"}')])
+        mock_execute.side_effect = lambda command: next(responses)(command)
+        first = execute_gh_command_cached(command, ttl=60)
+
+        # When
+        second = execute_gh_command_cached(command, ttl=60)
+
+        # Then
+        assert first.ok_value == '{"title": "old"}'
+        assert second.ok_value == '{"title": "new"}'
+        assert in_flight_after_invalidate == [False]
+        assert mock_execute.call_count == 2
@@ -0,0 +1,118 @@
+"""Unit tests for the handle_result decorator and response formatting."""
+
+import pytest
+from result import Err, Ok
+
+from gh_project_manager_mcp.utils.error import Error, ErrorCode
+from gh_project_manager_mcp.utils.response_handler import handle_result
+
+
+class TestHandleResult:
+    """Tests for handle_result."""
+
+    @pytest.mark.parametrize(
+        "output, expected_raw",
+        [
+            ('{"number": 1}', {"number": 1}),
+            ('[{"number": 1}]', [{"number": 1}]),
+            (
+                "https://github.com/owner/repo/issues/1",
+                "https://github.com/owner/repo/issues/1",
+            ),
+            ("{not json", "{not json"),
+            ("42", 42),
+            ("-1.5", -1.5),
+            ("true", True),
+            ("null", None),
+            ('"text"', "text"),
+            (' {"number": 1}', {"number": 1}),
+            ("the issue was closed", "the issue was closed"),
+            ("", ""),
+        ],
+    )
+    def test_success_output_is_decoded_when_json(
+        self, output: str, expected_raw: object
+    ) -> None:
+        """Test JSON output is decoded and other output is kept as text.
+
+        Given: A tool returning Ok with gh stdout
+        When: The decorated tool is called
+        Then: JSON values are decoded, anything else is returned as is
+        """
+        # Given
+        @handle_result
+        def tool():
+            return Ok(output)
+
+        # When
+        response = tool()
+
+        # Then
+        assert response == {"status": "SUCCESS", "raw": expected_raw}
+
+    def test_error_result_is_converted_to_dict(self) -> None:
+        """Test Err values are converted with Error.to_dict.
+
+        Given: A tool returning Err with an Error
+        When: The decorated tool is called
+        Then: The error dictionary is returned
+        """
+        # Given
+        @handle_result
+        def tool():
+            return Err(Error.required_param_missing(param="owner"))
+
+        # When
+        response = tool()
+
+        # Then
+        assert response["status"] == "FAILED"
+        assert response["code"] == ErrorCode.REQUIRED_PARAM_MISSING.name
+
+    def test_exception_is_converted_to_error(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test unexpected exceptions become GH_UNEXPECTED_ERROR responses.
+
+        Given: A tool that raises
+        When: The decorated tool is called
+        Then: A failed response with GH_UNEXPECTED_ERROR is returned and logged
+        """
+        # Given
+        @handle_result
+        def tool():
+            raise RuntimeError("boom")
+
+        # When
+        response = tool()
+
+        # Then
+        assert response["status"] == "FAILED"
+        assert response["code"] == ErrorCode.GH_UNEXPECTED_ERROR.name
+        assert "boom" in response["message"]
+        assert "ERROR in tool: boom" in caplog.text
+
+    @pytest.mark.parametrize("level, has_traceback", [("INFO", False), ("DEBUG", True)])
+    def test_traceback_only_included_when_debugging(
+        self, caplog: pytest.LogCaptureFixture, level: str, has_traceback: bool
+    ) -> None:
+        """Test the traceback is only part of the response at DEBUG level.
+
+        Given: A tool that raises and a configured log level
+        When: The decorated tool is called
+        Then: The response includes the traceback only when DEBUG is enabled
+        """
+        # Given
+        caplog.set_level(level, logger="gh_project_manager_mcp.utils.error")
+
+        @handle_result
+        def tool():
+            raise RuntimeError("boom")
+
+        # When
+        response = tool()
+
+        # Then
+        assert ("details" in response) is has_traceback
+        if has_traceback:
+            assert "RuntimeError: boom" in response["details"]["traceback"]